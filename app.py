@@ -107,6 +107,9 @@ def _restart_process():
     """Restart the current process to pick up new config."""
     try:
         _dbg("Restarting app to apply config changes...")
+        # execv skips atexit — persist any debounced bot pool claims first
+        if "engine.bot_pool" in sys.modules:
+            sys.modules["engine.bot_pool"].flush_pool()
         exe = sys.executable
         argv = sys.argv[:] if sys.argv else [exe]
         # Avoid duplicating the executable in argv.
@@ -694,6 +697,18 @@ def _acquire_lock() -> bool:
 def main():
     """Main entry point."""
     _dbg("main() entered")
+
+    # uvloop (optional) spawns and reaps subprocesses much faster than the
+    # default loop; every event loop created from here on picks it up.
+    # Don't install asyncio's PidfdChildWatcher instead: before 3.12 it is
+    # bound to a single loop and we run loops in several threads, and
+    # 3.12+ already reaps through pidfds on its own.
+    try:
+        import asyncio
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
     
     # Single-instance guard
     if not _acquire_lock():
@@ -6,9 +6,19 @@ Handles all the complexity so the bot.py doesn't have to.
 import asyncio
 import json
 import logging
+import re
 
 logger = logging.getLogger(__name__)
 
+# Markers the CLI router puts in its error replies; any of them means
+# "try the next provider". One compiled alternation, one scan per reply.
+_CLI_ERROR_RE = re.compile(
+    "|".join(map(re.escape, ("CLI error:", "timed out", "not found", "not authenticated", "not installed")))
+)
+
+# timeout -> CLIRouter, reused across chats (keeps its built env)
+_cli_routers: dict = {}
+
 
 async def chat(
     message: str,
@@ -72,7 +82,9 @@ async def _chat_cli(
         logger.error("CLI router not available")
         return "CLI routing is not available. Please use API provider instead."
 
-    router = CLIRouter(timeout=cli_timeout)
+    router = _cli_routers.get(cli_timeout)
+    if router is None:
+        router = _cli_routers[cli_timeout] = CLIRouter(timeout=cli_timeout)
 
     # Build message with conversation history (system prompt handled by router)
     user_message = message
@@ -88,42 +100,44 @@ async def _chat_cli(
 
     # Try primary provider
     primary = provider.lower().replace("-cli", "")
-    providers_to_try = [primary]
 
-    # Build fallback list from authenticated CLIs
-    try:
-        from engine.cli_installer import check_cli_installed, check_cli_auth_bool
-        for fallback in ["claude", "gemini", "codex"]:
+    def _fallbacks():
+        """Authenticated CLIs to fall back to, probed only once the primary fails."""
+        try:
+            from engine.cli_installer import PROVIDER_PRIORITY, check_cli_installed, check_cli_auth_bool
+        except ImportError:
+            return
+        for fallback in PROVIDER_PRIORITY:
             if fallback != primary and check_cli_installed(fallback) and check_cli_auth_bool(fallback):
-                providers_to_try.append(fallback)
-    except ImportError:
-        pass
-
-    _error_indicators = ("CLI error:", "timed out", "not found", "not authenticated", "not installed")
+                yield fallback
 
-    for i, prov in enumerate(providers_to_try):
+    fallbacks = _fallbacks()
+    prov = primary
+    while True:
         try:
             response = await router.chat(
                 message=user_message,
                 provider=prov,
-                cli_path=cli_path if i == 0 else None,
+                cli_path=cli_path if prov == primary else None,
                 system_prompt=system_prompt,
             )
             # Check if response is an error
-            if any(indicator in response for indicator in _error_indicators):
-                if i < len(providers_to_try) - 1:
-                    logger.warning(f"{prov} CLI failed: {response[:100]}. Trying {providers_to_try[i+1]}...")
+            if _CLI_ERROR_RE.search(response):
+                next_prov = next(fallbacks, None)
+                if next_prov:
+                    logger.warning(f"{prov} CLI failed: {response[:100]}. Trying {next_prov}...")
+                    prov = next_prov
                     continue
             return response
         except Exception as e:
             logger.error(f"{prov} CLI error: {e}")
-            if i < len(providers_to_try) - 1:
-                logger.info(f"Falling back from {prov} to {providers_to_try[i+1]}")
+            next_prov = next(fallbacks, None)
+            if next_prov:
+                logger.info(f"Falling back from {prov} to {next_prov}")
+                prov = next_prov
                 continue
             return f"Sorry, I had trouble with the CLI tool. Error: {str(e)[:100]}"
 
-    return "All CLI providers failed. Please check your settings."
-
 
 async def _chat_gemini(
     message: str, model: str, api_key: str,
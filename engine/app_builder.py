@@ -13,7 +13,7 @@ from typing import Optional
 
 from engine.ai import chat
 from engine.router import classify_message, pick_model
-from engine.config import get_api_key, get_cli_timeout
+from engine.config import get_cli_timeout, get_provider_key
 
 logger = logging.getLogger(__name__)
 
@@ -340,7 +340,7 @@ async def build_app(prompt: str, config: dict) -> dict:
         # Step 2: Route through user's AI provider
         task_type = "complex"  # App generation is complex work
         provider, model = pick_model(task_type, config)
-        api_key = config.get(f"{provider}_key", "") or get_api_key(config)
+        api_key = get_provider_key(config, provider)
         
         logger.info(f"Using AI provider: {provider} with model: {model}")
         
@@ -7,10 +7,15 @@ User messages Kiyomi → Kiyomi responds using their AI → memory builds silent
 No terminal. No dashboard. No complexity visible.
 """
 import asyncio
+import contextlib
+import io
 import logging
+import shutil
+import subprocess
 import sys
 import time
 from pathlib import Path
+from typing import Iterator
 
 # Add engine dir to path
 sys.path.insert(0, str(Path(__file__).parent))
@@ -27,13 +32,17 @@ from engine.config import (
     load_config,
     save_config,
     get_api_key,
+    get_provider_key,
+    get_plaid_creds,
     get_cli_timeout,
     CONFIG_DIR,
+    FILES_DIR,
     MEMORY_DIR,
 )
 from router import classify_message, pick_model
 from ai import chat
 from engine.memory import log_conversation, get_recent_context, extract_and_remember, load_all_memory, extract_facts_from_message, save_fact, export_memory, lookup_person
+from engine.memory import CATEGORIES, get_memory_summary, tail_lines
 from engine.multi_user import UserManager
 from engine.reminders import parse_reminder_from_message, add_reminder, list_active_reminders
 from updater import is_update_request, check_for_updates, perform_update, restart_bot
@@ -49,6 +58,22 @@ from get_to_know import (
 from image_gen import is_image_request, generate_image
 from computer_control import is_computer_action, execute_computer_action
 
+# Optional feature modules — set to None when not bundled in this build
+try:
+    from profile_card import generate_compact_card, generate_profile_card, generate_doctor_card
+except ImportError:
+    generate_compact_card = generate_profile_card = generate_doctor_card = None
+try:
+    from receipt_scanner import (
+        looks_like_receipt_request, scan_receipt, process_receipt, get_receipt_history
+    )
+except ImportError:
+    looks_like_receipt_request = scan_receipt = process_receipt = get_receipt_history = None
+try:
+    from plaid_integration import is_bank_connected, get_connected_banks
+except ImportError:
+    is_bank_connected = get_connected_banks = None
+
 # Ensure config/logs dirs exist before configuring logging.
 ensure_dirs()
 _bot_log_handlers = [logging.FileHandler(CONFIG_DIR / "logs" / "kiyomi.log")]
@@ -69,24 +94,128 @@ user_manager = UserManager()
 conversation_history: list = []
 
 
+def _snapshot_files() -> set:
+    """List the generated-files dir (created once at startup by ensure_dirs)."""
+    try:
+        return set(FILES_DIR.iterdir())
+    except FileNotFoundError:
+        return set()
+
+
+@contextlib.asynccontextmanager
+async def _typing_if_slow(message, delay: float = 0.2):
+    """Show the typing indicator only if the wrapped work outlasts `delay`.
+
+    Fast commands (cache hits, small local reads) finish first and skip
+    the extra Telegram round-trip entirely.
+    """
+    async def _send_later():
+        await asyncio.sleep(delay)
+        try:
+            await message.reply_chat_action(ChatAction.TYPING)
+        except Exception as e:
+            logger.debug(f"Typing indicator failed: {e}")
+
+    task = asyncio.create_task(_send_later())
+    try:
+        yield
+    finally:
+        task.cancel()
+
+
+def _user_ctx(update: Update, context: ContextTypes.DEFAULT_TYPE) -> tuple[str, Path]:
+    """Return (telegram_id, memory dir) for the sender of this update.
+
+    The user lookup/creation runs once per user; after that the memory dir
+    is served from PTB's per-user context.user_data.
+    """
+    telegram_id = str(update.effective_user.id)
+    user_memory_dir = context.user_data.get("_mem_dir")
+    if user_memory_dir is None:
+        first_name = update.effective_user.first_name or "User"
+        user_manager.get_or_create_user(telegram_id, first_name)
+        user_memory_dir = user_manager.get_user_memory_dir(telegram_id)
+        context.user_data["_mem_dir"] = user_memory_dir
+    return telegram_id, user_memory_dir
+
+
+_FENCE_CLOSE = "\n```"
+_FENCE_REOPEN = "```\n"
+
+
+def _find_cut(text: str, start: int, end: int, floor: int | None = None) -> tuple[int, int]:
+    """Best break in text[start:end] as (cut, separator length to skip).
+
+    Separators at or before `floor` (default `start`) are not used.
+    """
+    floor = start if floor is None else floor
+    for sep in ("\n\n", "\n", " "):
+        cut = text.rfind(sep, start, end)
+        if cut > floor:
+            return cut, len(sep)
+    return end, 0
+
+
+def split_for_telegram(text: str, limit: int = 4000) -> Iterator[str]:
+    """Yield chunks of `text` that fit Telegram's message limit.
+
+    Prefers to break at a paragraph, then a line, then a space, and avoids
+    cutting a ``` code block in half when it can. A block longer than one
+    message is closed at the cut and reopened in the next chunk. Trailing
+    whitespace is dropped, and so are chunks that would be blank (Telegram
+    rejects empty messages); leading indentation is kept.
+
+    >>> list(split_for_telegram("hello\\n\\n  indented", 8))
+    ['hello', 'indented']
+    >>> list(split_for_telegram("```\\n" + "x" * 20, 16))
+    ['```\\nxxxxxxxx\\n```', '```\\nxxxxxxxxxxxx']
+    """
+    start = 0
+    end_of_text = len(text)
+    reopen = ""
+    while end_of_text - start + len(reopen) > limit:
+        budget = limit - len(reopen)
+        cut, skip = _find_cut(text, start, start + budget)
+        close = ""
+        # Still inside a code block at the cut — back up to its opening fence
+        if bool(reopen) != bool(text.count("```", start, cut) % 2):
+            fence = text.rfind("```", start, cut)
+            if fence > start:
+                cut, skip = fence, 0
+            else:
+                # The block starts at this chunk: split inside it, past the
+                # opening fence's own line so the chunk isn't an empty "```\n```"
+                end = start + budget - len(_FENCE_CLOSE)
+                floor = max(start, -1 if reopen else text.find("\n", start, end))
+                cut, skip = _find_cut(text, start, end, floor)
+                if not text[floor:cut].strip():
+                    cut, skip = end, 0  # only indentation before the break
+                close = _FENCE_CLOSE
+        body = text[start:cut].rstrip()
+        if body:
+            yield reopen + body + close
+        # Drop only the separator we broke at, so indentation survives
+        start = cut + skip
+        reopen = _FENCE_REOPEN if close else ""
+    body = text[start:].rstrip()
+    if body:
+        yield reopen + body
+
+
+async def _reply_long(message, text: str, parse_mode: str | None = None, limit: int = 4000):
+    """Reply with `text`, split into Telegram-sized chunks."""
+    for chunk in split_for_telegram(text, limit):
+        await message.reply_text(chunk, parse_mode=parse_mode)
+
+
 def get_bot_name(config: dict) -> str:
     """Get the bot's display name. Defaults to 'Kiyomi' if not set."""
     return config.get("bot_name", "Kiyomi")
 
 
-def build_system_prompt(config: dict, user_dir: Path = None) -> str:
-    """Build personality prompt using the bot's actual name."""
-    name = config.get("name", "there")
-    bot_name = get_bot_name(config)
-    
-    # Load deep memory (categorized facts, documents, recent conversations)
-    memory_block = load_all_memory(user_dir=user_dir)
-    
-    # Get skill context (health, budget, tasks data)
-    skills_context = get_skills_prompt_context()
-    capabilities = get_skill_capabilities_prompt()
-    
-    prompt = f"""You are {bot_name} — {name}'s personal assistant. Not a chatbot. Not an app. You are their EMPLOYEE.
+# Static parts of the system prompt, formatted with name/bot_name only.
+# The per-message parts (memory, skills) are spliced in between.
+_PROMPT_HEAD = """You are {bot_name} — {name}'s personal assistant. Not a chatbot. Not an app. You are their EMPLOYEE.
 
 Think of yourself as a real assistant who works for {name}. You know their life, their family, their work, their health, their preferences. You USE that knowledge constantly. You don't wait to be asked — you anticipate needs, follow up on things, and get work done.
 
@@ -97,13 +226,9 @@ How you behave:
 - When they tell you to do something, DO IT IMMEDIATELY. Don't ask "would you like me to...?" — an employee doesn't ask permission to do their job.
 - Remember EVERYTHING. Every detail they share is important. Names, dates, preferences, complaints, goals — all of it.
 
-{f"WHAT I KNOW ABOUT {name.upper()} (use this naturally in conversation):" if memory_block else ""}
-{memory_block}
-
-{skills_context}
-{capabilities}
+"""
 
-FOR BUSINESS USERS: If {name} runs a business, you are their virtual employee. You remember clients, cases, deadlines, contacts. You draft documents, track tasks, remind about follow-ups. You are more reliable than a human assistant because you never forget. A lawyer tells you about a case once — you remember the client name, opposing counsel, deadlines, and key facts FOREVER.
+_PROMPT_TAIL = """FOR BUSINESS USERS: If {name} runs a business, you are their virtual employee. You remember clients, cases, deadlines, contacts. You draft documents, track tasks, remind about follow-ups. You are more reliable than a human assistant because you never forget. A lawyer tells you about a case once — you remember the client name, opposing counsel, deadlines, and key facts FOREVER.
 
 
 TOOLS: You have real tools you can use silently:
@@ -130,6 +255,26 @@ CRITICAL RULES:
 4. KEEP RESPONSES SHORT. This is Telegram on a phone. 2-4 sentences max for casual chat. Only go longer when they ask for detailed info.
 5. When you create a file, tell them briefly what you made (1 sentence). The file appears automatically right after your message.
 """
+
+
+def build_system_prompt(config: dict, user_dir: Path = None) -> str:
+    """Build personality prompt using the bot's actual name."""
+    name = config.get("name", "there")
+    bot_name = get_bot_name(config)
+    
+    # Load deep memory (categorized facts, documents, recent conversations)
+    memory_block = load_all_memory(user_dir=user_dir)
+    
+    # Get skill context (health, budget, tasks data)
+    skills_context = get_skills_prompt_context()
+    capabilities = get_skill_capabilities_prompt()
+    
+    memory_header = f"WHAT I KNOW ABOUT {name.upper()} (use this naturally in conversation):" if memory_block else ""
+    prompt = (
+        _PROMPT_HEAD.format(name=name, bot_name=bot_name)
+        + f"{memory_header}\n{memory_block}\n\n{skills_context}\n{capabilities}\n\n"
+        + _PROMPT_TAIL.format(name=name)
+    )
     return prompt.strip()
 
 
@@ -153,13 +298,8 @@ async def _handle_message_inner(update: Update, context: ContextTypes.DEFAULT_TY
     config = load_config()
     user_msg = update.message.text.strip()
     
-    # Get user's Telegram ID and first name
-    telegram_id = str(update.effective_user.id)
-    first_name = update.effective_user.first_name or "User"
-    
-    # Get or create user and their memory directory
-    user_info = user_manager.get_or_create_user(telegram_id, first_name)
-    user_memory_dir = user_manager.get_user_memory_dir(telegram_id)
+    # Get user's Telegram ID and memory directory
+    telegram_id, user_memory_dir = _user_ctx(update, context)
     
     # Store Telegram user ID on first message
     if not config.get("telegram_user_id"):
@@ -431,9 +571,7 @@ async def _handle_message_inner(update: Update, context: ContextTypes.DEFAULT_TY
     provider, model = pick_model(task_type, config)
     api_key = ""
     if not provider.endswith("-cli"):
-        api_key = config.get(f"{provider}_key", "")
-        if not api_key:
-            api_key = get_api_key(config)
+        api_key = get_provider_key(config, provider)
         if not api_key:
             await update.message.reply_text(
                 "I'm not connected to an AI service yet! 😅\n\n"
@@ -462,9 +600,7 @@ async def _handle_message_inner(update: Update, context: ContextTypes.DEFAULT_TY
         return
 
     # Snapshot files dir BEFORE AI call (to detect new files after)
-    files_dir = CONFIG_DIR / "files"
-    files_dir.mkdir(parents=True, exist_ok=True)
-    files_before = set(files_dir.iterdir()) if files_dir.exists() else set()
+    files_before = _snapshot_files()
 
     ai_message = user_msg
     if url_context:
@@ -513,27 +649,20 @@ async def _handle_message_inner(update: Update, context: ContextTypes.DEFAULT_TY
     
     # Send response
     # Split long messages for Telegram (4096 char limit)
-    if len(response) > 4000:
-        chunks = [response[i:i+4000] for i in range(0, len(response), 4000)]
-        for chunk in chunks:
-            await update.message.reply_text(chunk)
-    else:
-        await update.message.reply_text(response)
+    await _reply_long(update.message, response)
 
     # Send any NEW files created during this AI call
-    if files_dir.exists():
-        files_after = set(files_dir.iterdir())
-        new_files = files_after - files_before
-        for f in new_files:
-            if f.is_file():
-                try:
-                    with open(f, "rb") as fh:
-                        await update.message.reply_document(
-                            document=fh, filename=f.name
-                        )
-                    logger.info(f"Sent file: {f.name}")
-                except Exception as e:
-                    logger.error(f"Failed to send file {f.name}: {e}")
+    new_files = _snapshot_files() - files_before
+    for f in new_files:
+        if f.is_file():
+            try:
+                with open(f, "rb") as fh:
+                    await update.message.reply_document(
+                        document=fh, filename=f.name
+                    )
+                logger.info(f"Sent file: {f.name}")
+            except Exception as e:
+                logger.error(f"Failed to send file {f.name}: {e}")
 
 
 async def handle_voice(update: Update, context: ContextTypes.DEFAULT_TYPE):
@@ -560,10 +689,7 @@ async def handle_photo(update: Update, context: ContextTypes.DEFAULT_TYPE):
     config = load_config()
 
     # Get user's memory directory
-    telegram_id = str(update.effective_user.id)
-    first_name = update.effective_user.first_name or "User"
-    user_info = user_manager.get_or_create_user(telegram_id, first_name)
-    user_memory_dir = user_manager.get_user_memory_dir(telegram_id)
+    telegram_id, user_memory_dir = _user_ctx(update, context)
 
     await update.message.reply_chat_action(ChatAction.TYPING)
 
@@ -576,23 +702,22 @@ async def handle_photo(update: Update, context: ContextTypes.DEFAULT_TYPE):
         photo_path = CONFIG_DIR / "temp" / f"photo_{photo.file_id}.jpg"
         photo_path.parent.mkdir(parents=True, exist_ok=True)
         await photo_file.download_to_drive(photo_path)
+        photo_str = str(photo_path)  # scanners/analyzers take str paths
 
         caption = update.message.caption or ""
 
         # --- Receipt detection (check BEFORE generic analysis) ---
         try:
-            from receipt_scanner import looks_like_receipt_request, scan_receipt, process_receipt
-
             # Gather recent user messages for context
             recent_user_msgs = [
                 m["content"] for m in conversation_history[-6:]
                 if m.get("role") == "user"
             ]
 
-            if looks_like_receipt_request(caption, recent_user_msgs):
+            if looks_like_receipt_request is not None and looks_like_receipt_request(caption, recent_user_msgs):
                 # Route to receipt scanner
                 logger.info("Receipt detected — routing to receipt scanner")
-                scan_result = scan_receipt(str(photo_path), config)
+                scan_result = scan_receipt(photo_str, config)
                 response = process_receipt(scan_result)
 
                 await update.message.reply_text(response[:4000], parse_mode="Markdown")
@@ -607,8 +732,6 @@ async def handle_photo(update: Update, context: ContextTypes.DEFAULT_TYPE):
                 # Cleanup
                 photo_path.unlink(missing_ok=True)
                 return
-        except ImportError:
-            logger.warning("receipt_scanner module not available")
         except Exception as e:
             logger.error(f"Receipt scan error: {e}")
             # Fall through to generic analysis
@@ -620,7 +743,7 @@ async def handle_photo(update: Update, context: ContextTypes.DEFAULT_TYPE):
         # Use analyze_image tool
         from engine.tools import analyze_image
 
-        result = analyze_image(str(photo_path), caption)
+        result = analyze_image(photo_str, caption)
 
         await update.message.reply_text(result[:4000])
 
@@ -636,10 +759,7 @@ async def handle_document(update: Update, context: ContextTypes.DEFAULT_TYPE):
     config = load_config()
 
     # Get user's memory directory
-    telegram_id = str(update.effective_user.id)
-    first_name = update.effective_user.first_name or "User"
-    user_info = user_manager.get_or_create_user(telegram_id, first_name)
-    user_memory_dir = user_manager.get_user_memory_dir(telegram_id)
+    telegram_id, user_memory_dir = _user_ctx(update, context)
 
     await update.message.reply_chat_action(ChatAction.TYPING)
 
@@ -662,8 +782,6 @@ async def handle_document(update: Update, context: ContextTypes.DEFAULT_TYPE):
 
         if suffix == ".pdf":
             try:
-                import subprocess
-
                 result = subprocess.run(
                     ["pdftotext", str(file_path), "-"],
                     capture_output=True, text=True, timeout=10,
@@ -718,12 +836,10 @@ async def handle_document(update: Update, context: ContextTypes.DEFAULT_TYPE):
             logger.info(f"Saved document to memory: {doc_md}")
 
             # Pass to AI for analysis
-            from router import classify_message, pick_model
-
             system_prompt = build_system_prompt(config, user_dir=user_memory_dir)
             task_type = classify_message(f"analyze file: {filename}")
             provider, model = pick_model(task_type, config)
-            api_key = config.get(f"{provider}_key", "") or get_api_key(config)
+            api_key = get_provider_key(config, provider)
             prompt = (
                 f"The user sent a file called '{filename}'. Here's the content:\n\n"
                 f"{content}\n\n"
@@ -911,13 +1027,8 @@ async def cmd_tasks(update: Update, context: ContextTypes.DEFAULT_TYPE):
 
 async def cmd_memory(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Show what Kiyomi remembers — organized by category."""
-    from engine.memory import CATEGORIES, MEMORY_DIR, get_memory_summary
-    
     # Get user's memory directory
-    telegram_id = str(update.effective_user.id)
-    first_name = update.effective_user.first_name or "User"
-    user_info = user_manager.get_or_create_user(telegram_id, first_name)
-    user_memory_dir = user_manager.get_user_memory_dir(telegram_id)
+    telegram_id, user_memory_dir = _user_ctx(update, context)
     
     summary = get_memory_summary(user_dir=user_memory_dir)
     config = load_config()
@@ -934,10 +1045,8 @@ async def cmd_memory(update: Update, context: ContextTypes.DEFAULT_TYPE):
             # Read actual facts for display
             filepath = user_memory_dir / filename
             if filepath.exists():
-                content = filepath.read_text(encoding="utf-8", errors="replace")
-                fact_lines = [l.strip() for l in content.splitlines() if l.strip().startswith("- ")]
-                # Show up to 5 facts per category
-                display = fact_lines[-5:]
+                # Show up to 5 facts per category (read from the end of the file)
+                display = tail_lines(filepath, 5)
                 emoji_map = {
                     "identity": "👤", "family": "👨‍👩‍👧‍👦", "work": "💼",
                     "health": "💊", "preferences": "⭐", "goals": "🎯",
@@ -959,42 +1068,46 @@ async def cmd_memory(update: Update, context: ContextTypes.DEFAULT_TYPE):
     await update.message.reply_text("\n".join(lines), parse_mode="Markdown")
 
 
-async def cmd_export(update: Update, context: ContextTypes.DEFAULT_TYPE):
-    """Handle /export command — send memory as .md and .docx files."""
-    import tempfile
+def _render_docx(md_content: str, title: str) -> bytes:
+    """Render markdown to .docx bytes (CPU-bound; run off the event loop)."""
     from engine.tools import markdown_to_docx
 
+    doc = markdown_to_docx(md_content, title=title)
+    buf = io.BytesIO()
+    doc.save(buf)
+    return buf.getvalue()
+
+
+async def cmd_export(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """Handle /export command — send memory as .md and .docx files."""
     config = load_config()
     name = config.get("name", "there")
 
     # Get user's memory directory
-    telegram_id = str(update.effective_user.id)
-    first_name = update.effective_user.first_name or "User"
-    user_info = user_manager.get_or_create_user(telegram_id, first_name)
-    user_memory_dir = user_manager.get_user_memory_dir(telegram_id)
+    telegram_id, user_memory_dir = _user_ctx(update, context)
 
     await update.message.chat.send_action(ChatAction.TYPING)
 
     try:
-        md_content = export_memory(user_dir=user_memory_dir)
-
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # Write markdown file
-            md_path = Path(tmpdir) / f"kiyomi_memory_{name}.md"
-            md_path.write_text(md_content, encoding="utf-8")
+        # File reads and docx rendering are blocking — keep them off the event loop
+        md_content = await asyncio.to_thread(export_memory, user_dir=user_memory_dir)
 
-            # Convert to docx
-            docx_path = Path(tmpdir) / f"kiyomi_memory_{name}.docx"
-            doc = markdown_to_docx(md_content, title=f"Everything I Know About {name}")
-            doc.save(str(docx_path))
+        # Render docx straight into memory — no temp files to write and re-read
+        docx_bytes = await asyncio.to_thread(
+            _render_docx, md_content, f"Everything I Know About {name}"
+        )
 
-            await update.message.reply_text(f"Here's everything I know about you, {name}! 📋")
+        await update.message.reply_text(f"Here's everything I know about you, {name}! 📋")
 
-            # Send both files
-            with open(md_path, "rb") as f:
-                await update.message.reply_document(document=f, filename=md_path.name)
-            with open(docx_path, "rb") as f:
-                await update.message.reply_document(document=f, filename=docx_path.name)
+        # Send both files — they're independent, so upload them concurrently
+        await asyncio.gather(
+            update.message.reply_document(
+                document=md_content.encode("utf-8"), filename=f"kiyomi_memory_{name}.md"
+            ),
+            update.message.reply_document(
+                document=docx_bytes, filename=f"kiyomi_memory_{name}.docx"
+            ),
+        )
 
     except Exception as e:
         logger.error(f"Export error: {e}")
@@ -1013,22 +1126,12 @@ async def cmd_lookup(update: Update, context: ContextTypes.DEFAULT_TYPE):
         return
 
     # Get user's memory directory
-    telegram_id = str(update.effective_user.id)
-    first_name = update.effective_user.first_name or "User"
-    user_info = user_manager.get_or_create_user(telegram_id, first_name)
-    user_memory_dir = user_manager.get_user_memory_dir(telegram_id)
+    telegram_id, user_memory_dir = _user_ctx(update, context)
 
-    await update.message.chat.send_action(ChatAction.TYPING)
+    async with _typing_if_slow(update.message):
+        result = await asyncio.to_thread(lookup_person, name_query, user_dir=user_memory_dir)
 
-    result = lookup_person(name_query, user_dir=user_memory_dir)
-
-    # Split if too long for Telegram
-    if len(result) > 4000:
-        chunks = [result[i:i+4000] for i in range(0, len(result), 4000)]
-        for chunk in chunks:
-            await update.message.reply_text(chunk, parse_mode="Markdown")
-    else:
-        await update.message.reply_text(result, parse_mode="Markdown")
+    await _reply_long(update.message, result, parse_mode="Markdown")
 
 
 async def cmd_forget(update: Update, context: ContextTypes.DEFAULT_TYPE):
@@ -1041,54 +1144,51 @@ async def cmd_forget(update: Update, context: ContextTypes.DEFAULT_TYPE):
 
 async def cmd_confirmforget(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Actually clear memory."""
-    import shutil
-    
     # Get user's memory directory
-    telegram_id = str(update.effective_user.id)
-    first_name = update.effective_user.first_name or "User"
-    user_info = user_manager.get_or_create_user(telegram_id, first_name)
-    user_memory_dir = user_manager.get_user_memory_dir(telegram_id)
+    telegram_id, user_memory_dir = _user_ctx(update, context)
     
     if user_memory_dir and user_memory_dir.exists():
         shutil.rmtree(user_memory_dir)
         user_memory_dir.mkdir(parents=True, exist_ok=True)
+    user_manager.invalidate(telegram_id)
+    context.user_data.pop("_mem_dir", None)
     conversation_history.clear()
     await update.message.reply_text("Memory cleared. Fresh start! 🌱")
 
 
 async def cmd_profile(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Handle /profile — generate the Know Me profile card."""
+    if generate_compact_card is None:
+        await update.message.reply_text("Profile card feature not available in this version.")
+        return
+    
     config = load_config()
-    await update.message.reply_chat_action(ChatAction.TYPING)
     
     try:
-        from profile_card import generate_compact_card, generate_profile_card, generate_doctor_card
-        
-        args = context.args
-        if args and args[0].lower() == "doctor":
+        mode = context.args[0].lower() if context.args else ""
+        if mode == "doctor":
             card = generate_doctor_card(config)
             await update.message.reply_text(card[:4000], parse_mode="Markdown")
             return
         
-        if args and args[0].lower() == "full":
-            card = generate_profile_card(config)
+        if mode == "full":
             # Full profile might be long — save as file
-            profile_path = Path.home() / ".kiyomi" / "files" / "my_profile.md"
-            profile_path.parent.mkdir(parents=True, exist_ok=True)
-            profile_path.write_text(card)
-            await update.message.reply_document(
-                document=open(profile_path, "rb"),
-                filename="My_Kiyomi_Profile.md",
-                caption="Here's your complete profile! 🪪"
-            )
+            profile_path = FILES_DIR / "my_profile.md"
+            async with _typing_if_slow(update.message):
+                card = await asyncio.to_thread(generate_profile_card, config)
+                await asyncio.to_thread(profile_path.write_text, card)
+            with profile_path.open("rb") as f:
+                await update.message.reply_document(
+                    document=f,
+                    filename="My_Kiyomi_Profile.md",
+                    caption="Here's your complete profile! 🪪"
+                )
             return
         
         # Default: compact card
         card = generate_compact_card(config)
         await update.message.reply_text(card[:4000], parse_mode="Markdown")
     
-    except ImportError:
-        await update.message.reply_text("Profile card feature not available in this version.")
     except Exception as e:
         logger.error(f"Profile card error: {e}")
         await update.message.reply_text("Hmm, had trouble generating your profile. Try again?")
@@ -1096,19 +1196,20 @@ async def cmd_profile(update: Update, context: ContextTypes.DEFAULT_TYPE):
 
 async def cmd_receipts(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Show recent receipt scan history."""
-    await update.message.chat.send_action(ChatAction.TYPING)
+    if get_receipt_history is None:
+        await update.message.reply_text("Receipt scanning is being set up! 🔧")
+        return
+    
     try:
-        from receipt_scanner import get_receipt_history
         days = 30
         if context.args:
             try:
                 days = int(context.args[0])
             except ValueError:
                 pass
-        result = get_receipt_history(days)
+        async with _typing_if_slow(update.message):
+            result = await asyncio.to_thread(get_receipt_history, days)
         await update.message.reply_text(result[:4000], parse_mode="Markdown")
-    except ImportError:
-        await update.message.reply_text("Receipt scanning is being set up! 🔧")
     except Exception as e:
         logger.error(f"Receipts command error: {e}")
         await update.message.reply_text("Sorry, I had trouble loading receipt history. 😅")
@@ -1116,84 +1217,55 @@ async def cmd_receipts(update: Update, context: ContextTypes.DEFAULT_TYPE):
 
 async def cmd_connect(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Handle /connect — connect a bank account via Plaid."""
-    try:
-        from plaid_integration import is_bank_connected, get_connected_banks
-        
-        config = load_config()
-        plaid_cfg = config.get("plaid", {})
-        client_id = plaid_cfg.get("client_id", "")
-        secret = plaid_cfg.get("secret", "")
-        
-        if not client_id or not secret:
-            await update.message.reply_text(
-                "🏦 **Bank Connection**\n\n"
-                "Plaid isn't set up yet. To connect your bank:\n\n"
-                "1. Open Kiyomi Settings\n"
-                "2. Go to Integrations → Plaid\n"
-                "3. Add your Plaid API keys\n"
-                "4. Then run /connect again\n\n"
-                "Get free API keys at https://dashboard.plaid.com",
-                parse_mode="Markdown",
-            )
-            return
-        
-        if is_bank_connected():
-            banks = get_connected_banks()
-            bank_list = "\n".join(
-                f"  ✅ {b['institution']} (connected {b['connected_at'][:10]})"
-                for b in banks
-            )
-            await update.message.reply_text(
-                f"🏦 **Connected Banks**\n\n{bank_list}\n\n"
-                "Try:\n"
-                "• \"How much did I spend this week?\"\n"
-                "• \"What's my bank balance?\"\n"
-                "• \"How much did I spend on food?\"\n\n"
-                "To add another bank, use the Kiyomi app.",
-                parse_mode="Markdown",
-            )
-        else:
-            await update.message.reply_text(
-                "🏦 **Connect Your Bank**\n\n"
-                "To link your bank account, open the Kiyomi app "
-                "and tap 'Connect Bank' in Settings.\n\n"
-                "Once connected, you can ask me:\n"
-                "• \"How much did I spend this month?\"\n"
-                "• \"What's my balance?\"\n"
-                "• \"Am I on budget?\"\n\n"
-                "Your data stays private — only you and I can see it. 🔒",
-                parse_mode="Markdown",
-            )
-    except ImportError:
+    if is_bank_connected is None:
         await update.message.reply_text(
             "Bank connection isn't available in this version. "
             "Update Kiyomi to get Plaid integration!"
         )
+        return
+    
+    client_id, secret, _ = get_plaid_creds()
 
+    if not client_id or not secret:
+        await update.message.reply_text(
+            "🏦 **Bank Connection**\n\n"
+            "Plaid isn't set up yet. To connect your bank:\n\n"
+            "1. Open Kiyomi Settings\n"
+            "2. Go to Integrations → Plaid\n"
+            "3. Add your Plaid API keys\n"
+            "4. Then run /connect again\n\n"
+            "Get free API keys at https://dashboard.plaid.com",
+            parse_mode="Markdown",
+        )
+        return
 
-
-
-
-async def proactive_check_loop(app: Application):
-    """Run proactive checks every 4 hours."""
-    try:
-        from skills.proactive import run_proactive_check
-        config = load_config()
-        chat_id = config.get("telegram_user_id", "")
-        if not chat_id:
-            logger.info("No user ID yet — skipping proactive checks until first message")
-            return
-        
-        while True:
-            await asyncio.sleep(4 * 60 * 60)  # 4 hours
-            try:
-                await run_proactive_check(app.bot, chat_id)
-            except Exception as e:
-                logger.error(f"Proactive check failed: {e}")
-    except ImportError:
-        logger.info("Proactive module not available — running without proactive checks")
-    except Exception as e:
-        logger.error(f"Proactive loop error: {e}")
+    if is_bank_connected():
+        banks = get_connected_banks()
+        bank_list = "\n".join(
+            f"  ✅ {b['institution']} (connected {b['connected_at'][:10]})"
+            for b in banks
+        )
+        await update.message.reply_text(
+            f"🏦 **Connected Banks**\n\n{bank_list}\n\n"
+            "Try:\n"
+            "• \"How much did I spend this week?\"\n"
+            "• \"What's my bank balance?\"\n"
+            "• \"How much did I spend on food?\"\n\n"
+            "To add another bank, use the Kiyomi app.",
+            parse_mode="Markdown",
+        )
+    else:
+        await update.message.reply_text(
+            "🏦 **Connect Your Bank**\n\n"
+            "To link your bank account, open the Kiyomi app "
+            "and tap 'Connect Bank' in Settings.\n\n"
+            "Once connected, you can ask me:\n"
+            "• \"How much did I spend this month?\"\n"
+            "• \"What's my balance?\"\n"
+            "• \"Am I on budget?\"\n\n"
+            "Your data stays private — only you and I can see it. 🔒",
+            parse_mode="Markdown",
+        )
 
 
 async def post_init(app: Application):
@@ -1260,9 +1332,9 @@ async def post_init(app: Application):
     except Exception as e:
         logger.error(f"Startup update check failed: {e}")
     
-    asyncio.create_task(proactive_check_loop(app))
-    
-    # Start the Scheduler (fires reminders, morning briefs, skill nudges)
+    # Start the Scheduler (fires reminders, morning briefs, skill nudges).
+    # Skill nudges run from its 2-hourly _skill_nudges job, so there is no
+    # separate proactive loop sleeping alongside it.
     try:
         from scheduler import Scheduler
         config = load_config()
@@ -1275,14 +1347,21 @@ async def post_init(app: Application):
             logger.info("No user ID yet — scheduler will start on first message")
     except Exception as e:
         logger.warning(f"Scheduler failed to start: {e}")
+
+    # Keep the morning calendar windows warm so the brief answers from memory
+    try:
+        from engine.calendar_integration import is_calendar_configured, start_calendar_prefetcher
+        if is_calendar_configured():
+            start_calendar_prefetcher()
+            logger.info("🗓️ Calendar prefetcher started")
+    except Exception as e:
+        logger.warning(f"Calendar prefetcher failed to start: {e}")
     
     logger.info("🌸 Background tasks started")
 
 
 async def cmd_apps(update: Update, context: ContextTypes.DEFAULT_TYPE):
     """Handle /apps command — show recent apps built by Kiyomi."""
-    await update.message.chat.send_action(ChatAction.TYPING)
-    
     try:
         from app_builder import get_recent_apps, get_app_stats
         
@@ -1318,13 +1397,7 @@ async def cmd_apps(update: Update, context: ContextTypes.DEFAULT_TYPE):
             "Want a new app? Just tell me what you need! 🎯"
         )
         
-        # Split if too long for Telegram
-        if len(response) > 4000:
-            chunks = [response[i:i+4000] for i in range(0, len(response), 4000)]
-            for chunk in chunks:
-                await update.message.reply_text(chunk, parse_mode="Markdown")
-        else:
-            await update.message.reply_text(response, parse_mode="Markdown")
+        await _reply_long(update.message, response, parse_mode="Markdown")
         
     except ImportError:
         await update.message.reply_text("App builder feature is being set up! 🔧")
@@ -1333,6 +1406,37 @@ async def cmd_apps(update: Update, context: ContextTypes.DEFAULT_TYPE):
         await update.message.reply_text("Sorry, I had trouble loading your apps. 😅")
 
 
+# Command name -> handler. Registered as a single CommandHandler, so PTB
+# matches commands with one set lookup instead of trying each handler.
+_COMMANDS = {
+    "start": cmd_start,
+    "help": cmd_help,
+    "reminders": cmd_reminders,
+    "forget": cmd_forget,
+    "confirmforget": cmd_confirmforget,
+    "health": cmd_health,
+    "budget": cmd_budget,
+    "tasks": cmd_tasks,
+    "gettoknow": cmd_gettoknow,
+    "memory": cmd_memory,
+    "export": cmd_export,
+    "lookup": cmd_lookup,
+    "connect": cmd_connect,
+    "receipts": cmd_receipts,
+    "profile": cmd_profile,
+    "apps": cmd_apps,
+}
+
+
+async def _dispatch_command(update: Update, context: ContextTypes.DEFAULT_TYPE):
+    """Route a /command to its handler in _COMMANDS."""
+    text = update.effective_message.text or update.effective_message.caption or ""
+    command = text.split(maxsplit=1)[0][1:].split("@", 1)[0].lower()
+    handler = _COMMANDS.get(command)
+    if handler is not None:
+        await handler(update, context)
+
+
 def _build_app():
     """Build the Telegram application with all handlers."""
     config = load_config()
@@ -1345,22 +1449,7 @@ def _build_app():
     app = Application.builder().token(token).post_init(post_init).build()
     
     # Commands
-    app.add_handler(CommandHandler("start", cmd_start))
-    app.add_handler(CommandHandler("help", cmd_help))
-    app.add_handler(CommandHandler("reminders", cmd_reminders))
-    app.add_handler(CommandHandler("forget", cmd_forget))
-    app.add_handler(CommandHandler("confirmforget", cmd_confirmforget))
-    app.add_handler(CommandHandler("health", cmd_health))
-    app.add_handler(CommandHandler("budget", cmd_budget))
-    app.add_handler(CommandHandler("tasks", cmd_tasks))
-    app.add_handler(CommandHandler("gettoknow", cmd_gettoknow))
-    app.add_handler(CommandHandler("memory", cmd_memory))
-    app.add_handler(CommandHandler("export", cmd_export))
-    app.add_handler(CommandHandler("lookup", cmd_lookup))
-    app.add_handler(CommandHandler("connect", cmd_connect))
-    app.add_handler(CommandHandler("receipts", cmd_receipts))
-    app.add_handler(CommandHandler("profile", cmd_profile))
-    app.add_handler(CommandHandler("apps", cmd_apps))
+    app.add_handler(CommandHandler(list(_COMMANDS), _dispatch_command))
     
     # Messages
     app.add_handler(MessageHandler(filters.TEXT & ~filters.COMMAND, handle_message))
@@ -1373,6 +1462,11 @@ def _build_app():
 
 def main():
     """Start the bot (works from main thread only — uses signal handlers)."""
+    try:
+        import uvloop
+        asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    except ImportError:
+        pass
     app = _build_app()
     if not app:
         sys.exit(1)
@@ -5,29 +5,120 @@ Bots are created ahead of time via scripts/create_bots.py and stored in
 data/bot_pool.json. During onboarding, a user claims an unclaimed bot
 and gets a direct link to start chatting.
 """
-import json
+import atexit
+import heapq
 import logging
+import os
+import threading
 from pathlib import Path
-from datetime import datetime
+from datetime import datetime, timezone
+from typing import Optional
+
+from engine.config import dumps_json, loads_json
 
 logger = logging.getLogger(__name__)
 
 POOL_FILE = Path(__file__).parent.parent / "data" / "bot_pool.json"
 
+# In-memory copy of bot_pool.json, reloaded only when the file changes.
+# _unclaimed is a min-heap of indexes into pool["bots"] so claims still go
+# to the first free bot in file order; _by_token maps token -> index.
+_lock = threading.RLock()
+_pool: Optional[dict] = None
+_pool_stamp: Optional[tuple[int, int]] = None
+_unclaimed: list[int] = []
+_by_token: dict[str, int] = {}
+
+# Pending-write state for _save_pool's debounce
+SAVE_DEBOUNCE = 0.1  # seconds
+_dirty = False
+_flush_timer: Optional[threading.Timer] = None
+
+
+def _pool_file_stamp() -> Optional[tuple[int, int]]:
+    """Return (mtime_ns, size) of POOL_FILE, or None if it doesn't exist."""
+    try:
+        st = POOL_FILE.stat()
+    except FileNotFoundError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _index_pool(pool: dict):
+    """Rebuild the unclaimed heap and token index for `pool`."""
+    global _unclaimed, _by_token
+    bots = pool.get("bots", [])
+    _unclaimed = [i for i, b in enumerate(bots) if not b.get("claimed")]
+    heapq.heapify(_unclaimed)
+    _by_token = {b["token"]: i for i, b in enumerate(bots) if b.get("token")}
+
 
 def _load_pool() -> dict:
-    """Load the bot pool from disk."""
-    if not POOL_FILE.exists():
-        return {"bots": []}
-    with open(POOL_FILE) as f:
-        return json.load(f)
+    """Load the bot pool, re-reading the file only if it changed on disk."""
+    global _pool, _pool_stamp
+    with _lock:
+        # Unflushed changes win over whatever is on disk
+        if _pool is not None and _dirty:
+            return _pool
+        stamp = _pool_file_stamp()
+        if _pool is not None and stamp == _pool_stamp:
+            return _pool
+        if stamp is None:
+            pool = {"bots": []}
+        else:
+            pool = loads_json(POOL_FILE.read_bytes())
+        pool.setdefault("bots", [])
+        _pool, _pool_stamp = pool, stamp
+        _index_pool(pool)
+        return pool
+
+
+def _write_pool(pool: dict):
+    """Write the bot pool to disk.
+
+    Writes to a temp file and renames it over POOL_FILE, so a crash
+    mid-write never leaves a truncated pool behind.
+    """
+    global _pool_stamp
+    with _lock:
+        POOL_FILE.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = POOL_FILE.with_suffix(".json.tmp")
+        with open(tmp_path, "wb") as f:
+            f.write(dumps_json(pool))
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_path, POOL_FILE)
+        _pool_stamp = _pool_file_stamp()
 
 
 def _save_pool(pool: dict):
-    """Save the bot pool to disk."""
-    POOL_FILE.parent.mkdir(parents=True, exist_ok=True)
-    with open(POOL_FILE, "w") as f:
-        json.dump(pool, f, indent=2)
+    """Mark the pool dirty and schedule a write.
+
+    Claims that arrive in a burst within SAVE_DEBOUNCE seconds share one
+    disk write. The in-memory pool is authoritative in the meantime.
+    """
+    global _dirty, _flush_timer
+    with _lock:
+        _dirty = True
+        if _flush_timer is None:
+            _flush_timer = threading.Timer(SAVE_DEBOUNCE, flush_pool)
+            _flush_timer.daemon = True
+            _flush_timer.start()
+
+
+def flush_pool():
+    """Write any pending pool changes to disk now."""
+    global _dirty, _flush_timer
+    with _lock:
+        if _flush_timer is not None:
+            _flush_timer.cancel()
+            _flush_timer = None
+        if _dirty and _pool is not None:
+            _write_pool(_pool)
+            _dirty = False
+
+
+atexit.register(flush_pool)
 
 
 def claim_bot(claimed_by: str = "") -> dict | None:
@@ -40,22 +131,27 @@ def claim_bot(claimed_by: str = "") -> dict | None:
         Dict with {token, username, display_name, deep_link} or None if
         no bots are available.
     """
-    pool = _load_pool()
-
-    for bot in pool["bots"]:
-        if not bot.get("claimed"):
+    with _lock:
+        pool = _load_pool()
+        bots = pool["bots"]
+
+        while _unclaimed:
+            bot = bots[heapq.heappop(_unclaimed)]
+            if bot.get("claimed"):
+                continue
             bot["claimed"] = True
             bot["claimed_by"] = claimed_by or "onboarding"
-            bot["claimed_at"] = datetime.now().isoformat()
+            bot["claimed_at"] = datetime.now(timezone.utc).isoformat()
             _save_pool(pool)
 
-            username = bot["username"].lstrip("@")
+            # Newer pools store these precomputed by scripts/create_bots.py
+            username = bot.get("canonical_username") or bot["username"].lstrip("@")
             logger.info(f"Bot claimed: @{username} by {claimed_by}")
             return {
                 "token": bot["token"],
                 "username": username,
                 "display_name": bot.get("display_name", "Kiyomi"),
-                "deep_link": f"https://t.me/{username}",
+                "deep_link": bot.get("deep_link") or f"https://t.me/{username}",
             }
 
     logger.warning("No unclaimed bots available in pool")
@@ -71,18 +167,21 @@ def release_bot(token: str) -> bool:
     Returns:
         True if released, False if not found.
     """
-    pool = _load_pool()
-
-    for bot in pool["bots"]:
-        if bot["token"] == token:
-            bot["claimed"] = False
-            bot["claimed_by"] = None
-            bot.pop("claimed_at", None)
-            _save_pool(pool)
-            logger.info(f"Bot released: @{bot['username']}")
-            return True
-
-    return False
+    with _lock:
+        pool = _load_pool()
+        index = _by_token.get(token)
+        if index is None:
+            return False
+
+        bot = pool["bots"][index]
+        if bot.get("claimed"):
+            heapq.heappush(_unclaimed, index)
+        bot["claimed"] = False
+        bot["claimed_by"] = None
+        bot.pop("claimed_at", None)
+        _save_pool(pool)
+        logger.info(f"Bot released: @{bot['username']}")
+        return True
 
 
 def get_pool_status() -> dict:
@@ -91,18 +190,20 @@ def get_pool_status() -> dict:
     Returns:
         Dict with {total, available, claimed, bots: [...]}
     """
-    pool = _load_pool()
-    bots = pool.get("bots", [])
-    claimed = sum(1 for b in bots if b.get("claimed"))
+    with _lock:
+        pool = _load_pool()
+        total = len(pool["bots"])
+        available = len(_unclaimed)
 
     return {
-        "total": len(bots),
-        "available": len(bots) - claimed,
-        "claimed": claimed,
+        "total": total,
+        "available": available,
+        "claimed": total - available,
     }
 
 
 def has_available_bots() -> bool:
     """Check if there are any unclaimed bots in the pool."""
-    pool = _load_pool()
-    return any(not b.get("claimed") for b in pool.get("bots", []))
+    with _lock:
+        _load_pool()
+        return bool(_unclaimed)
@@ -8,19 +8,31 @@ Features:
   - create_event(...)          → Create a new calendar event
   - find_free_time(date)       → Find open slots on a given day
   - morning_briefing()         → Concise daily summary for morning brief
+  - dashboard(days)            → Briefing + today + upcoming in one batched fetch
+  - start_calendar_prefetcher() → Keep the morning briefing warm in the background
   - setup_calendar()           → Interactive OAuth2 setup flow
 """
 
 from __future__ import annotations
 
+import bisect
+import functools
 import json
+import logging
 import os
-from datetime import datetime, timedelta, time as dtime
+import re
+import threading
+import time
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone, time as dtime
 from pathlib import Path
 from typing import Any
 from zoneinfo import ZoneInfo
 
-from engine.config import CONFIG_DIR, load_config
+from engine.config import CONFIG_DIR, get_config_value
+
+logger = logging.getLogger(__name__)
 
 # ---------------------------------------------------------------------------
 # Paths
@@ -68,13 +80,22 @@ _EVENT_EMOJIS: dict[str, str] = {
 _DEFAULT_EMOJI = "📅"
 
 
+# One pass over the title finds every keyword occurrence (the lookahead
+# lets matches overlap); the earliest keyword in _EVENT_EMOJIS order wins.
+_EMOJI_RANK: dict[str, int] = {keyword: i for i, keyword in enumerate(_EVENT_EMOJIS)}
+_EMOJI_RE = re.compile("(?=(" + "|".join(map(re.escape, _EVENT_EMOJIS)) + "))")
+
+
+@functools.lru_cache(maxsize=512)
 def _emoji_for(title: str) -> str:
-    """Pick an emoji based on keywords in the event title."""
-    lower = title.lower()
-    for keyword, emoji in _EVENT_EMOJIS.items():
-        if keyword in lower:
-            return emoji
-    return _DEFAULT_EMOJI
+    """Pick an emoji based on keywords in the event title.
+
+    Memoized: recurring events repeat the same titles on every listing.
+    """
+    hits = _EMOJI_RE.findall(title.lower())
+    if not hits:
+        return _DEFAULT_EMOJI
+    return _EVENT_EMOJIS[min(hits, key=_EMOJI_RANK.__getitem__)]
 
 
 # ---------------------------------------------------------------------------
@@ -83,9 +104,16 @@ def _emoji_for(title: str) -> str:
 
 def _get_user_tz() -> ZoneInfo:
     """Return the user's configured timezone, falling back to local system tz."""
-    config = load_config()
-    tz_name = config.get("timezone", "")
+    return _resolve_tz(get_config_value("timezone", ""))
 
+
+@functools.lru_cache(maxsize=8)
+def _resolve_tz(tz_name: str) -> ZoneInfo:
+    """Map a configured timezone name to a ZoneInfo (memoized per name).
+
+    The config read is mtime-cached, so repeat calls cost one stat()
+    plus this dict lookup instead of rebuilding the ZoneInfo each time.
+    """
     if tz_name and tz_name != "UTC":
         try:
             return ZoneInfo(tz_name)
@@ -115,9 +143,9 @@ def _get_user_tz() -> ZoneInfo:
     return ZoneInfo("UTC")
 
 
-def _now() -> datetime:
-    """Current datetime in user's timezone."""
-    return datetime.now(tz=_get_user_tz())
+def _now(tz: ZoneInfo | None = None) -> datetime:
+    """Current datetime in `tz`, or the user's timezone if not given."""
+    return datetime.now(tz=tz or _get_user_tz())
 
 
 # ---------------------------------------------------------------------------
@@ -129,11 +157,54 @@ def is_calendar_configured() -> bool:
     return CREDENTIALS_FILE.exists()
 
 
-def _get_credentials():
+# Credentials are kept in memory between calls. Within _REFRESH_AHEAD of
+# expiry they count as stale: callers keep using them while a background
+# thread refreshes the token, so only a truly expired token blocks a call.
+_REFRESH_AHEAD = timedelta(minutes=5)
+_creds = None
+_creds_stamp: tuple[int, int] | None = None  # TOKEN_FILE (mtime_ns, size) behind _creds
+_creds_lock = threading.Lock()
+_creds_refreshing = False
+# After a failed background refresh, wait this long before starting another
+_REFRESH_RETRY = 60  # seconds
+_refresh_failed_at: float | None = None  # monotonic time of the last failure
+
+
+def _token_stamp() -> tuple[int, int] | None:
+    """Return (mtime_ns, size) of TOKEN_FILE, or None if it doesn't exist."""
+    try:
+        st = TOKEN_FILE.stat()
+    except FileNotFoundError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _refresh_in_background(creds) -> None:
+    """Refresh `creds` off the request path and persist the new token."""
+    global _creds_refreshing, _refresh_failed_at
+    failed_at = None
+    try:
+        from google.auth.transport.requests import Request
+        creds.refresh(Request())
+        _save_token(creds)
+    except Exception as e:
+        # The blocking path retries once the token actually expires
+        failed_at = time.monotonic()
+        if _refresh_failed_at is None:
+            logger.warning(f"Background calendar token refresh failed: {e}")
+    finally:
+        with _creds_lock:
+            _creds_refreshing = False
+            _refresh_failed_at = failed_at
+
+
+def _get_credentials(interactive: bool = True):
     """Load or refresh Google OAuth2 credentials.
 
-    Returns a google.oauth2.credentials.Credentials object or None.
+    Returns a google.oauth2.credentials.Credentials object or None. With
+    interactive=False, returns None instead of opening the browser OAuth flow.
     """
+    global _creds, _creds_stamp, _creds_refreshing
     try:
         from google.oauth2.credentials import Credentials
         from google.auth.transport.requests import Request
@@ -144,14 +215,33 @@ def _get_credentials():
             "  pip install google-auth google-auth-oauthlib google-api-python-client"
         )
 
-    creds = None
+    # Reuse the in-memory credentials unless the token file changed under us
+    # (e.g. another process re-authorized); only then parse it again.
+    stamp = _token_stamp()
+    creds = _creds if stamp == _creds_stamp else None
 
     # Load existing token
-    if TOKEN_FILE.exists():
+    if creds is None and stamp is not None:
         try:
             creds = Credentials.from_authorized_user_file(str(TOKEN_FILE), SCOPES)
         except Exception:
             creds = None
+        _creds_stamp = stamp
+
+    # Stale but still valid — refresh in the background, answer with what we have
+    if creds and creds.valid and creds.expiry and creds.refresh_token:
+        utc_now = datetime.now(timezone.utc).replace(tzinfo=None)  # expiry is naive UTC
+        if creds.expiry - utc_now < _REFRESH_AHEAD:
+            with _creds_lock:
+                start_refresh = not _creds_refreshing and (
+                    _refresh_failed_at is None
+                    or time.monotonic() - _refresh_failed_at >= _REFRESH_RETRY
+                )
+                _creds_refreshing = _creds_refreshing or start_refresh
+            if start_refresh:
+                threading.Thread(
+                    target=_refresh_in_background, args=(creds,), daemon=True
+                ).start()
 
     # Refresh if expired
     if creds and creds.expired and creds.refresh_token:
@@ -163,12 +253,14 @@ def _get_credentials():
 
     # Need new authorization
     if not creds or not creds.valid:
-        if not CREDENTIALS_FILE.exists():
+        if not interactive or not CREDENTIALS_FILE.exists():
+            _creds = None
             return None
         flow = InstalledAppFlow.from_client_secrets_file(str(CREDENTIALS_FILE), SCOPES)
         creds = flow.run_local_server(port=0, open_browser=True)
         _save_token(creds)
 
+    _creds = creds
     return creds
 
 
@@ -183,42 +275,105 @@ def _save_token(creds) -> None:
         "client_secret": creds.client_secret,
         "scopes": creds.scopes and list(creds.scopes),
     }
+    # Keep expiry so a restarted process knows when to refresh ahead of time
+    if creds.expiry:
+        token_data["expiry"] = creds.expiry.isoformat() + "Z"
+    global _creds_stamp
     TOKEN_FILE.write_text(json.dumps(token_data, indent=2), encoding="utf-8")
+    _creds_stamp = _token_stamp()
 
 
-def _get_service():
+# Per-thread (credentials, service) from the last build(). Token refreshes
+# mutate the credentials in place, so a service stays valid until they're
+# replaced. Each service owns one keep-alive httplib2 connection, and
+# httplib2 isn't thread-safe, so every thread gets its own.
+_HTTP_TIMEOUT = 30  # seconds
+_service_local = threading.local()
+
+
+def _get_service(interactive: bool = True):
     """Return an authorized Google Calendar API service."""
     from googleapiclient.discovery import build
+    import google_auth_httplib2
+    import httplib2
 
-    creds = _get_credentials()
+    creds = _get_credentials(interactive)
     if creds is None:
         raise RuntimeError(
             "Google Calendar not set up. Place your OAuth credentials at "
             f"{CREDENTIALS_FILE} and run setup_calendar()."
         )
-    return build("calendar", "v3", credentials=creds, cache_discovery=False)
+    cached = getattr(_service_local, "cache", None)
+    if cached is not None and cached[0] is creds:
+        return cached[1]
+    # One persistent connection per service: later list/insert/batch calls
+    # reuse it instead of paying a fresh TLS handshake each time.
+    authed_http = google_auth_httplib2.AuthorizedHttp(
+        creds, http=httplib2.Http(timeout=_HTTP_TIMEOUT)
+    )
+    service = build("calendar", "v3", http=authed_http, cache_discovery=False)
+    _service_local.cache = (creds, service)
+    return service
 
 
 # ---------------------------------------------------------------------------
 # Event formatting
 # ---------------------------------------------------------------------------
 
-def _parse_event_time(event: dict, key: str) -> datetime | None:
-    """Parse start or end time from a Google Calendar event dict."""
+@functools.lru_cache(maxsize=64)
+def _offset_tz(offset: str) -> timezone:
+    """Fixed-offset tzinfo for a '+HH:MM' / '-HH:MM' / 'Z' suffix."""
+    if offset == "Z":
+        return timezone.utc
+    delta = timedelta(hours=int(offset[1:3]), minutes=int(offset[4:6]))
+    return timezone(-delta if offset[0] == "-" else delta)
+
+
+def _parse_gcal_datetime(value: str) -> datetime:
+    """Parse a Calendar API dateTime by slicing its fixed layout.
+
+    The API sends 'YYYY-MM-DDTHH:MM:SS+HH:MM' (or a 'Z' suffix); anything
+    else goes through datetime.fromisoformat.
+    """
+    if len(value) in (20, 25) and value[10] == "T" and value[19] in "+-Z":
+        return datetime(
+            int(value[0:4]), int(value[5:7]), int(value[8:10]),
+            int(value[11:13]), int(value[14:16]), int(value[17:19]),
+            tzinfo=_offset_tz(value[19:]),
+        )
+    return datetime.fromisoformat(value)
+
+
+def _parse_event_time(event: dict, key: str, tz: ZoneInfo) -> datetime | None:
+    """Parse start or end time from a Google Calendar event dict into `tz`."""
     time_info = event.get(key, {})
-    tz = _get_user_tz()
 
     if "dateTime" in time_info:
-        dt = datetime.fromisoformat(time_info["dateTime"])
-        return dt.astimezone(tz)
+        return _parse_gcal_datetime(time_info["dateTime"]).astimezone(tz)
 
     if "date" in time_info:
-        d = datetime.strptime(time_info["date"], "%Y-%m-%d")
-        return d.replace(tzinfo=tz)
+        d = time_info["date"]  # "YYYY-MM-DD"
+        return datetime(int(d[0:4]), int(d[5:7]), int(d[8:10]), tzinfo=tz)
 
     return None
 
 
+def _event_times(event: dict, tz: ZoneInfo) -> tuple[datetime | None, datetime | None]:
+    """Return an event's (start, end) in `tz`, parsed once per event.
+
+    The result is stashed on the event dict under "_times" (tagged with the
+    tz it was computed for), so grouping, formatting and the free-time and
+    next-event scans share one parse — and cached listings keep it.
+    """
+    cached = event.get("_times")
+    if cached is not None and cached[0] is tz:
+        return cached[1], cached[2]
+    start = _parse_event_time(event, "start", tz)
+    end = _parse_event_time(event, "end", tz)
+    event["_times"] = (tz, start, end)
+    return start, end
+
+
 def _is_all_day(event: dict) -> bool:
     """Check whether an event is all-day."""
     return "date" in event.get("start", {})
@@ -226,19 +381,24 @@ def _is_all_day(event: dict) -> bool:
 
 def _format_time(dt: datetime) -> str:
     """Format a datetime as a human-friendly time string like '2:30 PM'."""
-    return dt.strftime("%-I:%M %p").replace(":00 ", " ").lstrip("0")
+    # Plain arithmetic instead of strftime: faster, and %-I isn't portable
+    hour, minute = dt.hour, dt.minute
+    ampm = "AM" if hour < 12 else "PM"
+    hour12 = hour % 12 or 12
+    if minute:
+        return f"{hour12}:{minute:02d} {ampm}"
+    return f"{hour12} {ampm}"
 
 
-def _format_event(event: dict, include_date: bool = False) -> str:
+def _format_event(event: dict, tz: ZoneInfo, include_date: bool = False) -> str:
     """Format a single event into a human-readable line with emoji."""
     title = event.get("summary", "Untitled Event")
     emoji = _emoji_for(title)
+    start, end = _event_times(event, tz)
 
     if _is_all_day(event):
         time_str = "All day"
     else:
-        start = _parse_event_time(event, "start")
-        end = _parse_event_time(event, "end")
         if start and end:
             time_str = f"{_format_time(start)} – {_format_time(end)}"
         elif start:
@@ -249,29 +409,507 @@ def _format_event(event: dict, include_date: bool = False) -> str:
     location = event.get("location", "")
     location_str = f" 📍 {location}" if location else ""
 
-    if include_date:
-        start = _parse_event_time(event, "start")
-        if start:
-            date_str = start.strftime("%a %b %-d")
-            return f"{emoji} {date_str} · {time_str} — {title}{location_str}"
+    if include_date and start:
+        date_str = start.strftime("%a %b %-d")
+        return f"{emoji} {date_str} · {time_str} — {title}{location_str}"
 
     return f"{emoji} {time_str} — {title}{location_str}"
 
 
-def _format_event_short(event: dict) -> str:
+def _format_event_short(event: dict, tz: ZoneInfo) -> str:
     """Ultra-short format for morning briefing: '10 AM Dentist'."""
     title = event.get("summary", "Untitled")
     if _is_all_day(event):
         return f"All-day: {title}"
-    start = _parse_event_time(event, "start")
+    start, _ = _event_times(event, tz)
     if start:
-        t = start.strftime("%-I %p").lstrip("0")
-        if start.minute:
-            t = start.strftime("%-I:%M %p").lstrip("0")
-        return f"{t} {title}"
+        return f"{_format_time(start)} {title}"
     return title
 
 
+# ---------------------------------------------------------------------------
+# Fetching
+# ---------------------------------------------------------------------------
+
+def _day_bounds(day, tz: ZoneInfo) -> tuple[datetime, datetime]:
+    """Return the first and last instant of `day` in `tz`."""
+    return (
+        datetime.combine(day, dtime.min, tzinfo=tz),
+        datetime.combine(day, dtime.max, tzinfo=tz),
+    )
+
+
+_WORK_START = dtime(8, 0)
+_WORK_END = dtime(21, 0)
+
+
+def _working_hours(day, tz: ZoneInfo) -> tuple[datetime, datetime]:
+    """Return the 8 AM – 9 PM window on `day` that free-time search covers."""
+    return (
+        datetime.combine(day, _WORK_START, tzinfo=tz),
+        datetime.combine(day, _WORK_END, tzinfo=tz),
+    )
+
+
+def _events_api(service):
+    """Return service.events(), building the resource once per service.
+
+    Each events() call constructs a fresh Resource and re-attaches its
+    discovery-generated methods; the result is safe to reuse.
+    """
+    cached = getattr(_service_local, "events", None)
+    if cached is not None and cached[0] is service:
+        return cached[1]
+    events = service.events()
+    _service_local.events = (service, events)
+    return events
+
+
+def _list_request(service, start: datetime, end: datetime, max_results: int | None = None):
+    """Build (but don't execute) an events().list request for a time window."""
+    kwargs: dict[str, Any] = {"maxResults": max_results} if max_results else {}
+    return _events_api(service).list(
+        calendarId="primary",
+        timeMin=start.isoformat(),
+        timeMax=end.isoformat(),
+        singleEvents=True,
+        orderBy="startTime",
+        **kwargs,
+    )
+
+
+# Per-window event mirrors keyed by (calendarId, timeMin, timeMax, maxResults).
+# Each entry holds the window's events, the listing's etag, the sync token
+# Google handed back (if any) and when it was last refreshed. Entries younger
+# than _EVENTS_TTL are served without a request. Older ones are refreshed
+# incrementally with their syncToken (only changed events come back), or
+# revalidated with If-None-Match when no token was issued.
+_EVENTS_TTL = 60  # seconds
+_EVENTS_MAX_WINDOWS = 32  # oldest-stored windows beyond this are dropped
+_events_cache: dict[tuple, dict[str, Any]] = {}
+# Windows are fetched from _fetch_pool threads and the prefetcher
+_events_lock = threading.Lock()
+
+
+def _invalidate_events_cache() -> None:
+    """Mark every cached window stale so the next read re-syncs it."""
+    with _events_lock:
+        for entry in list(_events_cache.values()):
+            entry["fetched_at"] = 0.0
+
+
+def _prune_events_cache() -> None:
+    """Drop windows that ended in the past, then the oldest until one more fits.
+
+    Caller holds _events_lock.
+    """
+    now = datetime.now(timezone.utc)
+    for key in list(_events_cache):
+        if datetime.fromisoformat(key[2]) <= now:
+            _events_cache.pop(key, None)
+    while len(_events_cache) >= _EVENTS_MAX_WINDOWS:
+        _events_cache.pop(next(iter(_events_cache)), None)
+
+
+def _http_status(exc: Exception) -> int | None:
+    """Return the HTTP status carried by a googleapiclient HttpError."""
+    return getattr(getattr(exc, "resp", None), "status", None)
+
+
+_UTC = ZoneInfo("UTC")
+_FAR_FUTURE = datetime.max.replace(tzinfo=_UTC)
+
+
+def _event_sort_key(event: dict) -> datetime:
+    """Start time used to keep merged events in startTime order."""
+    return _parse_event_time(event, "start", _UTC) or _FAR_FUTURE
+
+
+def _merge_sync_delta(key: tuple, events: list[dict], delta: list[dict]) -> list[dict]:
+    """Apply a syncToken delta to a window's events and re-filter to the window."""
+    by_id = {e.get("id"): e for e in events}
+    for event in delta:
+        if event.get("status") == "cancelled":
+            by_id.pop(event.get("id"), None)
+        else:
+            by_id[event.get("id")] = event
+
+    _, time_min, time_max, max_results = key
+    start = datetime.fromisoformat(time_min)
+    end = datetime.fromisoformat(time_max)
+    in_window = []
+    for event in by_id.values():
+        s = _parse_event_time(event, "start", start.tzinfo)
+        e = _parse_event_time(event, "end", start.tzinfo) or s
+        if s and s < end and e > start:
+            in_window.append(event)
+    in_window.sort(key=_event_sort_key)
+    return in_window[:max_results] if max_results else in_window
+
+
+def _prepare_window(
+    service, start: datetime, end: datetime, max_results: int | None,
+    max_age: float = _EVENTS_TTL,
+) -> tuple[tuple, list[dict] | None, Any]:
+    """Return (cache key, fresh cached events or None, request to send or None)."""
+    key = ("primary", start.isoformat(), end.isoformat(), max_results)
+    with _events_lock:
+        entry = _events_cache.get(key)
+        if entry and time.monotonic() - entry["fetched_at"] < max_age:
+            return key, entry["events"], None
+        sync_token = entry["sync_token"] if entry else ""
+        etag = entry["etag"] if entry else ""
+    if sync_token:
+        request = _events_api(service).list(
+            calendarId="primary", syncToken=sync_token, singleEvents=True
+        )
+    else:
+        request = _list_request(service, start, end, max_results)
+        if etag:
+            request.headers["If-None-Match"] = etag
+    return key, None, request
+
+
+def _store_window(key: tuple, response: dict | None, exc: Exception | None) -> list[dict] | None:
+    """Fold a window's response into the cache and return its events.
+
+    Returns None when the cached state is unusable (expired sync token,
+    or a delta too large for one page) and the window needs a full fetch.
+    """
+    with _events_lock:
+        return _store_window_locked(key, response, exc)
+
+
+def _store_window_locked(key: tuple, response: dict | None, exc: Exception | None) -> list[dict] | None:
+    """_store_window() body; caller holds _events_lock."""
+    entry = _events_cache.get(key)
+    now = time.monotonic()
+    if exc is not None:
+        status = _http_status(exc)
+        if entry is not None and status == 304:
+            entry["fetched_at"] = now
+            return entry["events"]
+        if entry is not None and status == 410:  # sync token expired
+            _events_cache.pop(key, None)
+            return None
+        raise exc
+
+    if entry is not None and entry["sync_token"]:
+        if response.get("nextPageToken"):
+            _events_cache.pop(key, None)
+            return None
+        entry["events"] = _merge_sync_delta(key, entry["events"], response.get("items", []))
+        entry["sync_token"] = response.get("nextSyncToken", "")
+        entry["fetched_at"] = now
+        return entry["events"]
+
+    events = response.get("items", [])
+    # Re-insert at the end so the cap evicts the least recently stored window
+    _events_cache.pop(key, None)
+    _prune_events_cache()
+    _events_cache[key] = {
+        "etag": response.get("etag", ""),
+        "events": events,
+        "sync_token": response.get("nextSyncToken", ""),
+        "fetched_at": now,
+    }
+    return events
+
+
+def _fetch_events(
+    service, start: datetime, end: datetime, max_results: int | None = None,
+    max_age: float = _EVENTS_TTL,
+) -> list[dict]:
+    """Fetch the events in one time window (through the window cache).
+
+    A cached copy younger than `max_age` seconds is returned as-is.
+    """
+    while True:
+        key, events, request = _prepare_window(service, start, end, max_results, max_age)
+        if request is None:
+            return events
+        try:
+            response, exc = request.execute(), None
+        except Exception as e:
+            response, exc = None, e
+        events = _store_window(key, response, exc)
+        if events is not None:
+            return events
+        # Cache entry was dropped — loop once more for a full listing
+
+
+def _fetch_windows(
+    service, windows: list[tuple[datetime, datetime, int | None]]
+) -> list[list[dict]]:
+    """Fetch several (start, end, max_results) windows in one batched HTTP call.
+
+    Windows still fresh in the cache are skipped, and any whose sync token
+    turned out to be stale are re-listed individually afterwards. Returns
+    one event list per window, in order, and raises the first per-window
+    error, if any.
+    """
+    results: list[list[dict] | None] = [[] for _ in windows]
+    keys: dict[str, tuple] = {}
+    errors: list[Exception] = []
+
+    def _collect(request_id: str, response: dict, exception: Exception | None) -> None:
+        try:
+            results[int(request_id)] = _store_window(keys[request_id], response, exception)
+        except Exception as e:
+            errors.append(e)
+
+    batch = service.new_batch_http_request(callback=_collect)
+    for i, (start, end, max_results) in enumerate(windows):
+        key, events, request = _prepare_window(service, start, end, max_results)
+        if request is None:
+            results[i] = events
+        else:
+            keys[str(i)] = key
+            batch.add(request, request_id=str(i))
+    if keys:
+        try:
+            batch.execute()
+        except Exception:
+            # The batch itself failed (e.g. the batch endpoint is unavailable) —
+            # send the windows as individual requests in parallel instead
+            return _fetch_windows_parallel(windows)
+
+    if errors:
+        raise errors[0]
+    for i, (start, end, max_results) in enumerate(windows):
+        if results[i] is None:
+            results[i] = _fetch_events(service, start, end, max_results)
+    return results
+
+
+# Long-lived so each worker keeps its own thread-local service and connection
+_FETCH_WORKERS = 4
+_fetch_pool: ThreadPoolExecutor | None = None
+
+
+def _fetch_windows_parallel(
+    windows: list[tuple[datetime, datetime, int | None]]
+) -> list[list[dict]]:
+    """Fetch windows as separate requests running concurrently on worker threads."""
+    global _fetch_pool
+    if _fetch_pool is None:
+        _fetch_pool = ThreadPoolExecutor(
+            max_workers=_FETCH_WORKERS, thread_name_prefix="calendar-fetch"
+        )
+
+    def _one(window: tuple[datetime, datetime, int | None]) -> list[dict]:
+        start, end, max_results = window
+        # httplib2 isn't thread-safe: use this worker's own service. The caller
+        # already holds valid credentials, so never start the OAuth flow here.
+        return _fetch_events(_get_service(interactive=False), start, end, max_results)
+
+    return list(_fetch_pool.map(_one, windows))
+
+
+# ---------------------------------------------------------------------------
+# Prefetching
+# ---------------------------------------------------------------------------
+
+_PREFETCH_INTERVAL = 300  # seconds
+_PREFETCH_HOURS = (6, 9)  # local hours [start, end) when the briefing is likely
+_prefetch_stop: threading.Event | None = None
+
+
+def _prefetch_today() -> None:
+    """Warm today's briefing and free-time windows during morning hours."""
+    # Never prefetch before setup — a missing token would start the browser OAuth flow
+    if not TOKEN_FILE.exists():
+        return
+    tz = _get_user_tz()
+    now = _now(tz)
+    if not _PREFETCH_HOURS[0] <= now.hour < _PREFETCH_HOURS[1]:
+        return
+    # A revoked or unrefreshable token must not pop a browser from a daemon thread
+    if _get_credentials(interactive=False) is None:
+        return
+    _fetch_windows(_get_service(interactive=False), [
+        (*_day_bounds(now.date(), tz), None),
+        (*_working_hours(now.date(), tz), None),
+    ])
+
+
+def start_calendar_prefetcher() -> threading.Event:
+    """Start a daemon thread that keeps the morning calendar windows warm.
+
+    Every _PREFETCH_INTERVAL seconds between 6 and 9 AM local time it
+    refreshes today's events, so morning_briefing() and find_free_time()
+    answer from memory. Returns an Event; set it to stop the thread.
+    Calling this again while the thread runs returns the same Event.
+    """
+    global _prefetch_stop
+    if _prefetch_stop is not None and not _prefetch_stop.is_set():
+        return _prefetch_stop
+    stop = threading.Event()
+
+    def _loop() -> None:
+        while True:
+            try:
+                _prefetch_today()
+            except Exception:
+                pass  # Best effort — the next tick or a real call will retry
+            if stop.wait(_PREFETCH_INTERVAL):
+                return
+
+    threading.Thread(target=_loop, name="calendar-prefetch", daemon=True).start()
+    _prefetch_stop = stop
+    return stop
+
+
+# ---------------------------------------------------------------------------
+# Rendering
+# ---------------------------------------------------------------------------
+
+def _render_todays_events(events: list[dict], now: datetime, tz: ZoneInfo) -> str:
+    """Format today's events as a day listing."""
+    if not events:
+        return "📭 No events today — your schedule is wide open!"
+
+    day_label = now.strftime("%A, %B %-d")
+    lines = [f"🗓️ **{day_label}** — {len(events)} event{'s' if len(events) != 1 else ''}:\n"]
+    for event in events:
+        lines.append(f"  {_format_event(event, tz)}")
+
+    return "\n".join(lines)
+
+
+def _render_upcoming_events(events: list[dict], days: int, tz: ZoneInfo) -> str:
+    """Format the next `days` days of events, grouped by day."""
+    if not events:
+        return f"📭 No events in the next {days} days — all clear!"
+
+    # Group by day
+    days_map: dict[str, list[dict]] = {}
+    for event in events:
+        start_dt, _ = _event_times(event, tz)
+        if start_dt:
+            day_key = start_dt.strftime("%A, %b %-d")
+            days_map.setdefault(day_key, []).append(event)
+
+    lines = [f"🗓️ **Next {days} days** — {len(events)} event{'s' if len(events) != 1 else ''}:\n"]
+    for day, day_events in days_map.items():
+        lines.append(f"**{day}**")
+        for event in day_events:
+            lines.append(f"  {_format_event(event, tz)}")
+        lines.append("")
+
+    return "\n".join(lines).strip()
+
+
+def _render_free_time(events: list[dict], target_date, tz: ZoneInfo) -> str:
+    """Format the open slots between 8 AM and 9 PM on `target_date`."""
+    day_start, day_end = _working_hours(target_date, tz)
+
+    # Busy blocks as parallel arrays of POSIX timestamps (all-day events
+    # don't block time), in startTime order from the API and cache merge.
+    starts = array("d")
+    ends = array("d")
+    for event in events:
+        if _is_all_day(event):
+            continue
+        s, e = _event_times(event, tz)
+        if s and e:
+            starts.append(s.timestamp())
+            ends.append(e.timestamp())
+
+    # One pass over plain floats: merge overlapping blocks and emit the
+    # gaps between them as we go.
+    free_slots: list[tuple[float, float]] = []
+    cursor = day_start.timestamp()
+    block_end: float | None = None
+    blocks = 0
+
+    for s, e in zip(starts, ends):
+        if block_end is not None and s <= block_end:
+            block_end = max(block_end, e)
+            continue
+        if block_end is not None:
+            cursor = max(cursor, block_end)
+        if cursor < s:
+            free_slots.append((cursor, s))
+        block_end = e
+        blocks += 1
+
+    if block_end is not None:
+        cursor = max(cursor, block_end)
+    day_end_ts = day_end.timestamp()
+    if cursor < day_end_ts:
+        free_slots.append((cursor, day_end_ts))
+
+    # Format output
+    day_label = target_date.strftime("%A, %b %-d")
+
+    if not free_slots:
+        return f"😬 No free time on **{day_label}** between 8 AM – 9 PM. Packed day!"
+
+    if not blocks:
+        return f"🎉 **{day_label}** is completely open (8 AM – 9 PM). No events!"
+
+    lines = [f"🕐 **Free time on {day_label}:**\n"]
+    for slot_start, slot_end in free_slots:
+        seconds = int(slot_end - slot_start)
+        hours = seconds // 3600
+        minutes = (seconds % 3600) // 60
+        dur_str = ""
+        if hours:
+            dur_str += f"{hours}h"
+        if minutes:
+            dur_str += f" {minutes}m"
+        dur_str = dur_str.strip()
+
+        lines.append(
+            f"  ✅ {_format_time(datetime.fromtimestamp(slot_start, tz))} – "
+            f"{_format_time(datetime.fromtimestamp(slot_end, tz))}  ({dur_str})"
+        )
+
+    lines.append(f"\n{blocks} event{'s' if blocks != 1 else ''} blocking time.")
+    return "\n".join(lines)
+
+
+def _render_briefing(events: list[dict], now: datetime, tz: ZoneInfo) -> str:
+    """Format today's events as a short morning summary."""
+    day_label = now.strftime("%A")
+
+    if not events:
+        return f"☀️ Good morning! No events on your calendar today ({day_label}). Enjoy the free day!"
+
+    count = len(events)
+    event_summaries = [_format_event_short(e, tz) for e in events]
+    event_list = ", ".join(event_summaries)
+
+    # Next event — events are in startTime order, so bisect past everything
+    # that has already started (events without a start sort last)
+    idx = bisect.bisect_right(
+        events, now, key=lambda e: _event_times(e, tz)[0] or _FAR_FUTURE
+    )
+    next_event = events[idx] if idx < count and _event_times(events[idx], tz)[0] else None
+
+    briefing = f"☀️ Good morning! You have **{count} event{'s' if count != 1 else ''}** today ({day_label}):\n"
+    briefing += f"  {event_list}"
+
+    if next_event:
+        next_start, _ = _event_times(next_event, tz)
+        if next_start:
+            delta = next_start - now
+            mins = int(delta.total_seconds() / 60)
+            if mins > 0:
+                if mins < 60:
+                    briefing += f"\n\n⏰ Next up: **{next_event.get('summary', 'Event')}** in {mins} minutes"
+                else:
+                    hours = mins // 60
+                    remaining_mins = mins % 60
+                    if remaining_mins:
+                        briefing += f"\n\n⏰ Next up: **{next_event.get('summary', 'Event')}** in {hours}h {remaining_mins}m"
+                    else:
+                        briefing += f"\n\n⏰ Next up: **{next_event.get('summary', 'Event')}** in {hours}h"
+
+    return briefing
+
+
 # ---------------------------------------------------------------------------
 # Public API
 # ---------------------------------------------------------------------------
@@ -302,8 +940,7 @@ def setup_calendar() -> str:
         creds = _get_credentials()
         if creds and creds.valid:
             # Verify by fetching calendar list
-            from googleapiclient.discovery import build
-            service = build("calendar", "v3", credentials=creds, cache_discovery=False)
+            service = _get_service()
             calendar_list = service.calendarList().list(maxResults=5).execute()
             calendars = calendar_list.get("items", [])
             cal_names = [c.get("summary", "Unnamed") for c in calendars[:5]]
@@ -331,36 +968,14 @@ def get_todays_events() -> str:
         return f"❌ Missing dependencies: {e}"
 
     tz = _get_user_tz()
-    now = _now()
-    start_of_day = datetime.combine(now.date(), dtime.min, tzinfo=tz)
-    end_of_day = datetime.combine(now.date(), dtime.max, tzinfo=tz)
+    now = _now(tz)
 
     try:
-        events_result = (
-            service.events()
-            .list(
-                calendarId="primary",
-                timeMin=start_of_day.isoformat(),
-                timeMax=end_of_day.isoformat(),
-                singleEvents=True,
-                orderBy="startTime",
-            )
-            .execute()
-        )
+        events = _fetch_events(service, *_day_bounds(now.date(), tz))
     except Exception as e:
         return f"❌ Failed to fetch events: {type(e).__name__}: {str(e)[:200]}"
 
-    events = events_result.get("items", [])
-
-    if not events:
-        return "📭 No events today — your schedule is wide open!"
-
-    day_label = now.strftime("%A, %B %-d")
-    lines = [f"🗓️ **{day_label}** — {len(events)} event{'s' if len(events) != 1 else ''}:\n"]
-    for event in events:
-        lines.append(f"  {_format_event(event)}")
-
-    return "\n".join(lines)
+    return _render_todays_events(events, now, tz)
 
 
 def get_upcoming_events(days: int = 7) -> str:
@@ -373,47 +988,16 @@ def get_upcoming_events(days: int = 7) -> str:
         return f"❌ Missing dependencies: {e}"
 
     tz = _get_user_tz()
-    now = _now()
+    now = _now(tz)
     start = datetime.combine(now.date(), dtime.min, tzinfo=tz)
     end = datetime.combine(now.date() + timedelta(days=days), dtime.max, tzinfo=tz)
 
     try:
-        events_result = (
-            service.events()
-            .list(
-                calendarId="primary",
-                timeMin=start.isoformat(),
-                timeMax=end.isoformat(),
-                singleEvents=True,
-                orderBy="startTime",
-                maxResults=50,
-            )
-            .execute()
-        )
+        events = _fetch_events(service, start, end, max_results=50)
     except Exception as e:
         return f"❌ Failed to fetch events: {type(e).__name__}: {str(e)[:200]}"
 
-    events = events_result.get("items", [])
-
-    if not events:
-        return f"📭 No events in the next {days} days — all clear!"
-
-    # Group by day
-    days_map: dict[str, list[dict]] = {}
-    for event in events:
-        start_dt = _parse_event_time(event, "start")
-        if start_dt:
-            day_key = start_dt.strftime("%A, %b %-d")
-            days_map.setdefault(day_key, []).append(event)
-
-    lines = [f"🗓️ **Next {days} days** — {len(events)} event{'s' if len(events) != 1 else ''}:\n"]
-    for day, day_events in days_map.items():
-        lines.append(f"**{day}**")
-        for event in day_events:
-            lines.append(f"  {_format_event(event)}")
-        lines.append("")
-
-    return "\n".join(lines).strip()
+    return _render_upcoming_events(events, days, tz)
 
 
 def create_event(
@@ -476,10 +1060,11 @@ def create_event(
         event_body["location"] = location
 
     try:
-        created = service.events().insert(calendarId="primary", body=event_body).execute()
+        created = _events_api(service).insert(calendarId="primary", body=event_body).execute()
     except Exception as e:
         return f"❌ Failed to create event: {type(e).__name__}: {str(e)[:200]}"
 
+    _invalidate_events_cache()
     link = created.get("htmlLink", "")
     emoji = _emoji_for(title)
 
@@ -499,6 +1084,8 @@ def create_event(
     return result
 
 
+
+
 def find_free_time(date: str = "") -> str:
     """Find open time slots on a given date.
 
@@ -523,87 +1110,17 @@ def find_free_time(date: str = "") -> str:
         except ValueError:
             return f"❌ Invalid date format: '{date}'. Use YYYY-MM-DD."
     else:
-        target_date = _now().date()
-
-    # Working hours window
-    day_start = datetime.combine(target_date, dtime(8, 0), tzinfo=tz)
-    day_end = datetime.combine(target_date, dtime(21, 0), tzinfo=tz)
+        target_date = _now(tz).date()
 
     try:
-        events_result = (
-            service.events()
-            .list(
-                calendarId="primary",
-                timeMin=day_start.isoformat(),
-                timeMax=day_end.isoformat(),
-                singleEvents=True,
-                orderBy="startTime",
-            )
-            .execute()
+        # Served straight from the prefetcher's copy when it's warm
+        events = _fetch_events(
+            service, *_working_hours(target_date, tz), max_age=_PREFETCH_INTERVAL
         )
     except Exception as e:
         return f"❌ Failed to fetch events: {type(e).__name__}: {str(e)[:200]}"
 
-    events = events_result.get("items", [])
-
-    # Build busy blocks (skip all-day events for gap analysis)
-    busy: list[tuple[datetime, datetime]] = []
-    for event in events:
-        if _is_all_day(event):
-            continue
-        s = _parse_event_time(event, "start")
-        e = _parse_event_time(event, "end")
-        if s and e:
-            busy.append((s, e))
-
-    # Sort and merge overlapping blocks
-    busy.sort(key=lambda b: b[0])
-    merged: list[tuple[datetime, datetime]] = []
-    for s, e in busy:
-        if merged and s <= merged[-1][1]:
-            merged[-1] = (merged[-1][0], max(merged[-1][1], e))
-        else:
-            merged.append((s, e))
-
-    # Find gaps
-    free_slots: list[tuple[datetime, datetime]] = []
-    cursor = day_start
-
-    for s, e in merged:
-        if cursor < s:
-            free_slots.append((cursor, s))
-        cursor = max(cursor, e)
-
-    if cursor < day_end:
-        free_slots.append((cursor, day_end))
-
-    # Format output
-    day_label = target_date.strftime("%A, %b %-d")
-
-    if not free_slots:
-        return f"😬 No free time on **{day_label}** between 8 AM – 9 PM. Packed day!"
-
-    if not merged:
-        return f"🎉 **{day_label}** is completely open (8 AM – 9 PM). No events!"
-
-    lines = [f"🕐 **Free time on {day_label}:**\n"]
-    for slot_start, slot_end in free_slots:
-        duration = slot_end - slot_start
-        hours = duration.seconds // 3600
-        minutes = (duration.seconds % 3600) // 60
-        dur_str = ""
-        if hours:
-            dur_str += f"{hours}h"
-        if minutes:
-            dur_str += f" {minutes}m"
-        dur_str = dur_str.strip()
-
-        lines.append(
-            f"  ✅ {_format_time(slot_start)} – {_format_time(slot_end)}  ({dur_str})"
-        )
-
-    lines.append(f"\n{len(merged)} event{'s' if len(merged) != 1 else ''} blocking time.")
-    return "\n".join(lines)
+    return _render_free_time(events, target_date, tz)
 
 
 def morning_briefing() -> str:
@@ -620,60 +1137,46 @@ def morning_briefing() -> str:
         return f"❌ Missing dependencies: {e}"
 
     tz = _get_user_tz()
-    now = _now()
-    start_of_day = datetime.combine(now.date(), dtime.min, tzinfo=tz)
-    end_of_day = datetime.combine(now.date(), dtime.max, tzinfo=tz)
+    now = _now(tz)
 
     try:
-        events_result = (
-            service.events()
-            .list(
-                calendarId="primary",
-                timeMin=start_of_day.isoformat(),
-                timeMax=end_of_day.isoformat(),
-                singleEvents=True,
-                orderBy="startTime",
-            )
-            .execute()
+        # Served straight from the prefetcher's copy when it's warm
+        events = _fetch_events(
+            service, *_day_bounds(now.date(), tz), max_age=_PREFETCH_INTERVAL
         )
     except Exception as e:
         return f"❌ Couldn't check your calendar: {type(e).__name__}: {str(e)[:200]}"
 
-    events = events_result.get("items", [])
-    day_label = now.strftime("%A")
+    return _render_briefing(events, now, tz)
 
-    if not events:
-        return f"☀️ Good morning! No events on your calendar today ({day_label}). Enjoy the free day!"
 
-    count = len(events)
-    event_summaries = [_format_event_short(e) for e in events]
-    event_list = ", ".join(event_summaries)
+def dashboard(days: int = 7) -> str:
+    """Morning briefing, today's events and the next N days in one round-trip.
 
-    # Next event
-    next_event = None
-    for event in events:
-        start_dt = _parse_event_time(event, "start")
-        if start_dt and start_dt > now:
-            next_event = event
-            break
+    Both time windows go out as a single batched HTTP request instead of
+    one events().list call per view.
+    """
+    try:
+        service = _get_service()
+    except RuntimeError as e:
+        return str(e)
+    except ImportError as e:
+        return f"❌ Missing dependencies: {e}"
 
-    briefing = f"☀️ Good morning! You have **{count} event{'s' if count != 1 else ''}** today ({day_label}):\n"
-    briefing += f"  {event_list}"
+    tz = _get_user_tz()
+    now = _now(tz)
+    start_of_day, end_of_day = _day_bounds(now.date(), tz)
+    end = datetime.combine(now.date() + timedelta(days=days), dtime.max, tzinfo=tz)
 
-    if next_event:
-        next_start = _parse_event_time(next_event, "start")
-        if next_start:
-            delta = next_start - now
-            mins = int(delta.total_seconds() / 60)
-            if mins > 0:
-                if mins < 60:
-                    briefing += f"\n\n⏰ Next up: **{next_event.get('summary', 'Event')}** in {mins} minutes"
-                else:
-                    hours = mins // 60
-                    remaining_mins = mins % 60
-                    if remaining_mins:
-                        briefing += f"\n\n⏰ Next up: **{next_event.get('summary', 'Event')}** in {hours}h {remaining_mins}m"
-                    else:
-                        briefing += f"\n\n⏰ Next up: **{next_event.get('summary', 'Event')}** in {hours}h"
+    try:
+        today, upcoming = _fetch_windows(
+            service, [(start_of_day, end_of_day, None), (start_of_day, end, 50)]
+        )
+    except Exception as e:
+        return f"❌ Failed to fetch events: {type(e).__name__}: {str(e)[:200]}"
 
-    return briefing
+    return "\n\n".join([
+        _render_briefing(today, now, tz),
+        _render_todays_events(today, now, tz),
+        _render_upcoming_events(upcoming, days, tz),
+    ])
@@ -8,17 +8,29 @@ Auth model: Users authenticate with their existing AI subscriptions
 No API keys needed.
 """
 import asyncio
+import copy
+import functools
 import json
 import logging
+import os
 import shutil
 import platform
-import webbrowser
+import re
+import time
+import urllib.parse
+import urllib.request
+from collections import deque
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Callable, Dict, Optional, Tuple
+
+from engine.config import loads_json
 
 logger = logging.getLogger(__name__)
 
 HOME = Path.home()
+_PLATFORM = platform.system()
+_IS_DARWIN = _PLATFORM == "Darwin"
 
 # ── PATH expansion (PyInstaller bundles have a stripped PATH) ────
 
@@ -32,29 +44,173 @@ _EXTRA_PATHS = [
 ]
 
 
+@functools.lru_cache(maxsize=4)
+def _expand_path(existing: str) -> str:
+    # Exact-entry matching (no substring false positives) and os.pathsep.
+    # Entries already on PATH keep their position; missing extras go in front.
+    entries = list(dict.fromkeys(p for p in existing.split(os.pathsep) if p))
+    present = set(entries)
+    missing = [p for p in reversed(_EXTRA_PATHS) if p not in present]
+    return os.pathsep.join(missing + entries)
+
+
 def _expanded_path() -> str:
-    """Build PATH string with common macOS CLI install locations."""
-    import os
-    existing = os.environ.get("PATH", "")
-    for p in _EXTRA_PATHS:
-        if p not in existing:
-            existing = f"{p}:{existing}"
-    return existing
+    """Build PATH string with common macOS CLI install locations.
+
+    Memoized on the process PATH, so it is only rebuilt if PATH changes.
+    """
+    return _expand_path(os.environ.get("PATH", ""))
+
+
+def _posix_which(name: str, path: str) -> Optional[str]:
+    """shutil.which() minus the PATHEXT/normcase handling POSIX doesn't need."""
+    if os.sep in name:
+        return name if os.path.isfile(name) and os.access(name, os.X_OK) else None
+    for directory in path.split(os.pathsep):
+        if not directory:
+            continue
+        candidate = os.path.join(directory, name)
+        if os.path.isfile(candidate) and os.access(candidate, os.X_OK):
+            return candidate
+    return None
+
+
+_which_impl = _posix_which if os.name == "posix" else shutil.which
+
+
+# (name, PATH searched) -> (checked_at, path). Hits stay cached until
+# invalidated; misses expire so a CLI installed outside Kiyomi still shows up.
+_WHICH_MISS_TTL = 60  # seconds
+_which_cache: Dict[Tuple[str, str], Tuple[float, Optional[str]]] = {}
 
 
 def _which(name: str) -> Optional[str]:
-    """shutil.which() with expanded PATH for PyInstaller compatibility."""
-    return shutil.which(name, path=_expanded_path())
+    """shutil.which() with expanded PATH for PyInstaller compatibility.
+
+    Cached, since each lookup stats every PATH entry. Misses expire after
+    _WHICH_MISS_TTL; hits are re-checked with a single access() so an
+    uninstalled binary is noticed on the next call.
+    """
+    search_path = _expanded_path()
+    key = (name, search_path)
+    cached = _which_cache.get(key)
+    if cached:
+        hit = cached[1]
+        if hit:
+            if os.access(hit, os.X_OK) and not os.path.isdir(hit):
+                return hit
+        elif time.monotonic() - cached[0] < _WHICH_MISS_TTL:
+            return None
+    path = _which_impl(name, path=search_path)
+    _which_cache[key] = (time.monotonic(), path)
+    return path
+
+
+def _which_invalidate(*names: str):
+    """Forget cached _which() lookups (all of them if no names given)."""
+    for key in list(_which_cache):
+        if not names or key[0] in names:
+            _which_cache.pop(key, None)
+
+
+def invalidate_path_cache():
+    """Forget every cached binary lookup (e.g. after installing a CLI by hand)."""
+    _which_invalidate()
 
 
 def _get_env() -> dict:
     """Build subprocess env with expanded PATH."""
-    import os
     env = os.environ.copy()
     env["PATH"] = _expanded_path()
     return env
 
 
+def get_cli_env() -> dict:
+    """Environment for running the AI CLIs (a fresh copy with expanded PATH)."""
+    return _get_env()
+
+
+async def _kill_process_group(proc: asyncio.subprocess.Process):
+    """Kill a child started with start_new_session=True plus anything it spawned."""
+    import signal
+    try:
+        os.killpg(proc.pid, signal.SIGKILL)
+    except ProcessLookupError:
+        pass
+    except (AttributeError, PermissionError):  # no process groups (Windows)
+        proc.kill()
+    await proc.wait()
+
+
+_OUTPUT_TAIL_LINES = 200  # output lines kept per stream for error reporting
+_READ_CHUNK = 65536
+
+
+def _log_line(line: bytes, sink: deque, name: str):
+    text = line.decode(errors="replace").rstrip()
+    sink.append(text)
+    logger.debug(f"{name}: {text}")
+
+
+async def _drain(stream: asyncio.StreamReader, sink: deque, name: str, full: Optional[list] = None):
+    """Log a subprocess stream line by line, keeping only its tail.
+
+    Reads fixed-size chunks, so a single huge line can't overflow the
+    reader. If `full` is given, every raw chunk is collected there too.
+    """
+    pending = b""
+    while chunk := await stream.read(_READ_CHUNK):
+        if full is not None:
+            full.append(chunk)
+        *lines, pending = (pending + chunk).split(b"\n")
+        for line in lines:
+            _log_line(line, sink, name)
+        if len(pending) > _READ_CHUNK:  # only the tail of a huge line is kept
+            pending = pending[-_READ_CHUNK:]
+    if pending:
+        _log_line(pending, sink, name)
+
+
+async def _run(
+    *argv: str, timeout: float, env: Optional[dict] = None,
+    capture_stderr: bool = True, keep_stdout: bool = False,
+) -> Tuple[int, str, str]:
+    """Run a command, streaming its output instead of buffering it all.
+
+    Every subprocess in this module goes through here. The child gets its
+    own session, and if anything goes wrong while waiting (timeout, the
+    caller being cancelled, ...) it is killed along with whatever it spawned.
+    With capture_stderr=False stderr goes to /dev/null (no pipe to poll).
+    Returns (returncode, stdout, stderr tail); stdout is the tail too unless
+    keep_stdout=True, for callers that parse it. Raises asyncio.TimeoutError
+    (after the kill) if it runs past `timeout`.
+    """
+    proc = await asyncio.create_subprocess_exec(
+        *argv,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE if capture_stderr else asyncio.subprocess.DEVNULL,
+        env=env if env is not None else _get_env(),
+        start_new_session=True,
+    )
+    name = Path(argv[0]).name
+    out: deque = deque(maxlen=_OUTPUT_TAIL_LINES)
+    err: deque = deque(maxlen=_OUTPUT_TAIL_LINES)
+    full_out: Optional[list] = [] if keep_stdout else None
+    readers = [_drain(proc.stdout, out, name, full_out)]
+    if capture_stderr:
+        readers.append(_drain(proc.stderr, err, name))
+    waiter = asyncio.gather(*readers, proc.wait())
+    try:
+        await asyncio.wait_for(waiter, timeout=timeout)
+    except BaseException:
+        await _kill_process_group(proc)
+        if waiter.done() and not waiter.cancelled():
+            waiter.exception()  # already being re-raised; don't log it again
+        raise
+    stdout = b"".join(full_out).decode(errors="replace") if keep_stdout else "\n".join(out)
+    return proc.returncode, stdout, "\n".join(err)
+
+
 # ── CLI package registry ─────────────────────────────────────────
 
 CLI_PACKAGES = {
@@ -65,48 +221,88 @@ CLI_PACKAGES = {
 
 # ── Auth config: where each CLI stores credentials on disk ───────
 
+def _validate_claude(data: dict) -> bool:
+    account = data.get("oauthAccount")
+    return type(account) is dict and bool(account.get("accountUuid"))
+
+
+def _validate_codex(data: dict) -> bool:
+    tokens = data.get("tokens")
+    return type(tokens) is dict and bool(tokens.get("access_token"))
+
+
+def _validate_gemini(data: dict) -> bool:
+    return bool(data.get("access_token")) and bool(data.get("refresh_token"))
+
+
+@dataclass(frozen=True, slots=True)
+class AuthConfig:
+    """Where a CLI keeps its credentials and how to sign it in."""
+    config_file: Path
+    auth_key: str
+    validate: Callable[[dict], bool]
+    auth_command: Tuple[str, ...]
+    subscription: str
+    display_name: str
+    status_command: Optional[Tuple[str, ...]] = None
+
+
 AUTH_CONFIG = {
-    "claude": {
-        "config_file": HOME / ".claude.json",
-        "auth_key": "oauthAccount",          # dict with accountUuid, emailAddress, etc.
-        "validate": lambda data: (
-            isinstance(data.get("oauthAccount"), dict)
-            and bool(data["oauthAccount"].get("accountUuid"))
-        ),
-        "auth_command": ["claude", "-p", "hello", "--output-format", "json"],
-        "subscription": "Claude Pro / Max ($20/mo)",
-        "display_name": "Claude",
-    },
-    "codex": {
-        "config_file": HOME / ".codex" / "auth.json",
-        "auth_key": "tokens",                # dict with access_token, refresh_token, etc.
-        "validate": lambda data: (
-            isinstance(data.get("tokens"), dict)
-            and bool(data["tokens"].get("access_token"))
-        ),
-        "status_command": ["codex", "login", "status"],
-        "auth_command": ["codex", "login"],
-        "subscription": "ChatGPT Plus ($20/mo)",
-        "display_name": "Codex",
-    },
-    "gemini": {
-        "config_file": HOME / ".gemini" / "oauth_creds.json",
-        "auth_key": "refresh_token",         # OAuth refresh token
-        "validate": lambda data: (
-            bool(data.get("access_token"))
-            and bool(data.get("refresh_token"))
-        ),
-        "auth_command": ["gemini", "-p", "hello"],
-        "subscription": "Google One AI Premium ($20/mo)",
-        "display_name": "Gemini",
-    },
+    "claude": AuthConfig(
+        config_file=HOME / ".claude.json",
+        auth_key="oauthAccount",          # dict with accountUuid, emailAddress, etc.
+        validate=_validate_claude,
+        auth_command=("claude", "-p", "hello", "--output-format", "json"),
+        subscription="Claude Pro / Max ($20/mo)",
+        display_name="Claude",
+    ),
+    "codex": AuthConfig(
+        config_file=HOME / ".codex" / "auth.json",
+        auth_key="tokens",                # dict with access_token, refresh_token, etc.
+        validate=_validate_codex,
+        status_command=("codex", "login", "status"),
+        auth_command=("codex", "login"),
+        subscription="ChatGPT Plus ($20/mo)",
+        display_name="Codex",
+    ),
+    "gemini": AuthConfig(
+        config_file=HOME / ".gemini" / "oauth_creds.json",
+        auth_key="refresh_token",         # OAuth refresh token
+        validate=_validate_gemini,
+        auth_command=("gemini", "-p", "hello"),
+        subscription="Google One AI Premium ($20/mo)",
+        display_name="Gemini",
+    ),
+}
+
+# Static half of get_subscription_info(); only installed/authenticated vary
+_SUB_INFO_TEMPLATE = tuple(
+    {
+        "provider": provider,
+        "display_name": cfg.display_name,
+        "subscription": cfg.subscription,
+    }
+    for provider, cfg in AUTH_CONFIG.items()
+)
+
+# Codex auth_mode -> (subscription, account) shown for that mode
+_CODEX_AUTH_MODES = {
+    "chatgpt": ("ChatGPT Plus (subscription)", "ChatGPT subscription"),
+    "api_key": ("OpenAI API key", "API key"),
 }
 
+# Preferred provider order (matches router.py preference order)
+PROVIDER_PRIORITY = ("claude", "gemini", "codex")
+
 
 # ═══════════════════════════════════════════════════════════════════
 # AUTH VERIFICATION — file-based, no subprocess needed
 # ═══════════════════════════════════════════════════════════════════
 
+# provider -> ((mtime_ns, size) of its config file, check_cli_auth result)
+_auth_cache: Dict[str, Tuple[Tuple[int, int], dict]] = {}
+
+
 def check_cli_installed(provider: str) -> Optional[str]:
     """Check if a CLI binary is on PATH.
 
@@ -115,15 +311,18 @@ def check_cli_installed(provider: str) -> Optional[str]:
     return _which(provider)
 
 
-def check_cli_auth(provider: str) -> dict:
-    """Check if a CLI is authenticated by inspecting config files on disk.
+def probe(provider: str, binary: Optional[str] = None) -> Tuple[Optional[str], bool]:
+    """(binary path, authenticated) for a provider in one call.
 
-    Returns dict with:
-        authenticated (bool): True if valid credentials found
-        subscription (str|None): Subscription tier if detectable
-        account (str|None): Account identifier (email, etc.)
-        detail (str): Human-readable status message
+    `binary` overrides the name/path looked up on PATH. Both halves are
+    served from cache on the hot path; auth is only checked if installed.
     """
+    path = _which(binary or provider)
+    return path, bool(path) and _auth_status(provider)["authenticated"]
+
+
+def _auth_status(provider: str) -> dict:
+    """check_cli_auth() without the defensive copy — callers must not mutate."""
     result = {
         "authenticated": False,
         "subscription": None,
@@ -136,21 +335,36 @@ def check_cli_auth(provider: str) -> dict:
         result["detail"] = f"Unknown provider: {provider}"
         return result
 
-    config_file = cfg["config_file"]
-    if not config_file.exists():
+    config_file = cfg.config_file
+    try:
+        st = config_file.stat()
+    except FileNotFoundError:
         result["detail"] = f"No auth config found at {config_file}"
         return result
+    except OSError as e:
+        result["detail"] = f"Could not read {config_file}: {e}"
+        return result
+
+    # Unchanged file -> same answer; skips re-parsing (~/.claude.json grows large)
+    stamp = (st.st_mtime_ns, st.st_size)
+    cached = _auth_cache.get(provider)
+    if cached and cached[0] == stamp:
+        return cached[1]
 
     try:
-        data = json.loads(config_file.read_text(encoding="utf-8"))
+        # Bytes straight to the parser: no str copy (orjson when installed)
+        data = loads_json(config_file.read_bytes())
+    except FileNotFoundError:
+        result["detail"] = f"No auth config found at {config_file}"
+        return result
     except (json.JSONDecodeError, OSError) as e:
         result["detail"] = f"Could not read {config_file}: {e}"
         return result
 
     # Run the provider-specific validation
-    if cfg["validate"](data):
+    if cfg.validate(data):
         result["authenticated"] = True
-        result["subscription"] = cfg["subscription"]
+        result["subscription"] = cfg.subscription
 
         # Extract account identifier for display
         if provider == "claude":
@@ -158,13 +372,8 @@ def check_cli_auth(provider: str) -> dict:
             result["account"] = acct.get("emailAddress") or acct.get("displayName")
         elif provider == "codex":
             auth_mode = data.get("auth_mode", "unknown")
-            # "chatgpt" means subscription auth, "api_key" means API key
-            if auth_mode == "chatgpt":
-                result["subscription"] = "ChatGPT Plus (subscription)"
-                result["account"] = "ChatGPT subscription"
-            elif auth_mode == "api_key":
-                result["subscription"] = "OpenAI API key"
-                result["account"] = "API key"
+            if auth_mode in _CODEX_AUTH_MODES:
+                result["subscription"], result["account"] = _CODEX_AUTH_MODES[auth_mode]
             else:
                 result["account"] = auth_mode
         elif provider == "gemini":
@@ -176,12 +385,35 @@ def check_cli_auth(provider: str) -> dict:
         result["detail"] = f"Config exists but credentials are incomplete"
         logger.info(f"{provider} auth incomplete at {config_file}")
 
+    _auth_cache[provider] = (stamp, result)
     return result
 
 
+def invalidate_auth_cache(provider: Optional[str] = None):
+    """Force the next auth check to re-read the config file (all providers if None)."""
+    if provider is None:
+        _auth_cache.clear()
+    else:
+        _auth_cache.pop(provider, None)
+
+
+def check_cli_auth(provider: str) -> dict:
+    """Check if a CLI is authenticated by inspecting config files on disk.
+
+    Results are cached against the config file's mtime and size.
+
+    Returns dict with:
+        authenticated (bool): True if valid credentials found
+        subscription (str|None): Subscription tier if detectable
+        account (str|None): Account identifier (email, etc.)
+        detail (str): Human-readable status message
+    """
+    return dict(_auth_status(provider))
+
+
 def check_cli_auth_bool(provider: str) -> bool:
     """Simple boolean auth check (convenience wrapper)."""
-    return check_cli_auth(provider)["authenticated"]
+    return _auth_status(provider)["authenticated"]
 
 
 # ═══════════════════════════════════════════════════════════════════
@@ -223,33 +455,24 @@ async def launch_cli_auth(provider: str) -> dict:
         result["detail"] = f"Already authenticated: {auth_status['detail']}"
         return result
 
-    auth_cmd = cfg["auth_command"]
+    auth_cmd = cfg.auth_command
     logger.info(f"Launching {provider} OAuth flow: {' '.join(auth_cmd)}")
 
     try:
-        proc = await asyncio.create_subprocess_exec(
-            *auth_cmd,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-            env=_get_env(),
-        )
-
         result["launched"] = True
         result["needs_browser"] = True
         result["detail"] = (
-            f"Opening {cfg['display_name']} login... "
-            f"Sign in with your {cfg['subscription']} account in the browser."
+            f"Opening {cfg.display_name} login... "
+            f"Sign in with your {cfg.subscription} account in the browser."
         )
 
         # Wait for auth to complete (generous timeout for browser interaction)
         try:
-            stdout, stderr = await asyncio.wait_for(
-                proc.communicate(), timeout=180
-            )
-            output = stdout.decode(errors="replace")
-            errors = stderr.decode(errors="replace")
+            _, output, errors = await _run(*auth_cmd, timeout=180)
 
-            # Verify auth completed
+            # Verify auth completed (re-read: an mtime/size match could be stale
+            # on filesystems with coarse timestamps)
+            invalidate_auth_cache(provider)
             post_auth = check_cli_auth(provider)
             if post_auth["authenticated"]:
                 result["detail"] = f"Authenticated successfully: {post_auth['detail']}"
@@ -262,8 +485,7 @@ async def launch_cli_auth(provider: str) -> dict:
 
         except asyncio.TimeoutError:
             # User may still be in the browser — check if auth landed
-            proc.kill()
-            await proc.wait()
+            invalidate_auth_cache(provider)
             post_auth = check_cli_auth(provider)
             if post_auth["authenticated"]:
                 result["detail"] = f"Authenticated successfully: {post_auth['detail']}"
@@ -291,15 +513,12 @@ async def launch_codex_auth_status() -> Optional[str]:
     if not codex_path:
         return None
     try:
-        proc = await asyncio.create_subprocess_exec(
-            codex_path, "login", "status",
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-            env=_get_env(),
+        # Network-bound (token refresh), so allow more than a local probe
+        returncode, stdout, _ = await _run(
+            codex_path, "login", "status", timeout=10, capture_stderr=False
         )
-        stdout, _ = await asyncio.wait_for(proc.communicate(), timeout=10)
-        if proc.returncode == 0:
-            return stdout.decode(errors="replace").strip()
+        if returncode == 0:
+            return stdout.strip()
     except Exception as e:
         logger.debug(f"codex login status failed: {e}")
     return None
@@ -309,48 +528,101 @@ async def launch_codex_auth_status() -> Optional[str]:
 # PREREQUISITES — Node.js, npm, Homebrew
 # ═══════════════════════════════════════════════════════════════════
 
-async def check_prerequisites() -> Dict[str, any]:
-    """Check if Node.js, npm, and Homebrew are available."""
+# (checked_at, result) from the last check_prerequisites() run. Tool versions
+# don't change under a running app unless we install something ourselves.
+_PREREQ_TTL = 12 * 3600  # seconds
+_prereq_cache: Optional[Tuple[float, Dict]] = None
+
+
+_NODE_VERSION_RE = re.compile(r"#define NODE_(MAJOR|MINOR|PATCH|VERSION_IS_RELEASE)(?:_VERSION)? (\d+)")
+
+
+def _installed_version(binary: str, path: str) -> Optional[str]:
+    """Read a tool's version from its install files, skipping a subprocess.
+
+    npm: the package.json next to the resolved npm-cli.js. node: the
+    node_version.h header under the binary's install prefix. Returns None
+    when the files aren't where we expect, so the caller falls back to
+    running `<binary> --version`.
+    """
+    try:
+        resolved = Path(path).resolve()
+        if binary == "npm":
+            for parent in list(resolved.parents)[:3]:
+                pkg = parent / "package.json"
+                if pkg.is_file():
+                    data = json.loads(pkg.read_text(encoding="utf-8"))
+                    if data.get("name") == "npm":
+                        return data.get("version")
+        elif binary == "node":
+            header = resolved.parent.parent / "include" / "node" / "node_version.h"
+            if header.is_file():
+                parts = dict(_NODE_VERSION_RE.findall(header.read_text(encoding="utf-8")))
+                if parts.get("VERSION_IS_RELEASE") == "1":
+                    return f"v{parts['MAJOR']}.{parts['MINOR']}.{parts['PATCH']}"
+    except (OSError, ValueError, KeyError):
+        pass
+    return None
+
+
+def _invalidate_prerequisites():
+    """Drop cached prerequisite results (e.g. after installing Node.js)."""
+    global _prereq_cache
+    _prereq_cache = None
+
+
+async def check_prerequisites(force: bool = False) -> Dict[str, any]:
+    """Check if Node.js, npm, and Homebrew are available.
+
+    Results are cached for _PREREQ_TTL; pass force=True to re-probe.
+    """
+    global _prereq_cache
+    if (
+        not force
+        and _prereq_cache is not None
+        and time.monotonic() - _prereq_cache[0] < _PREREQ_TTL
+    ):
+        return copy.deepcopy(_prereq_cache[1])
+
     logger.info("Checking CLI prerequisites...")
 
     result = {
         "node": {"available": False, "path": None, "version": None},
         "npm": {"available": False, "path": None, "version": None},
         "homebrew": {"available": False, "path": None, "version": None},
-        "platform": platform.system(),
+        "platform": _PLATFORM,
     }
 
-    async def _check_tool(binary: str, result_key: str = "", version_flag: str = "--version"):
+    async def _check_tool(binary: str, path: str, result_key: str = "", version_flag: str = "--version"):
         key = result_key or binary
-        path = _which(binary)
-        if not path:
+        version = _installed_version(binary, path)
+        if version:
+            result[key].update(available=True, path=path, version=version)
             return
         try:
-            proc = await asyncio.create_subprocess_exec(
-                path, version_flag,
-                stdout=asyncio.subprocess.PIPE,
-                stderr=asyncio.subprocess.PIPE,
-                env=_get_env(),
-            )
-            stdout, _ = await asyncio.wait_for(proc.communicate(), timeout=10)
-            if proc.returncode == 0:
+            # --version should be near-instant; anything slower is hung
+            returncode, stdout, _ = await _run(path, version_flag, timeout=3, capture_stderr=False)
+            if returncode == 0:
                 result[key]["available"] = True
                 result[key]["path"] = path
-                result[key]["version"] = stdout.decode().strip().split("\n")[0]
+                result[key]["version"] = stdout.strip().split("\n")[0]
         except Exception:
             pass
 
-    await asyncio.gather(
-        _check_tool("node"),
-        _check_tool("npm"),
-        *(
-            [_check_tool("brew", "homebrew")]
-            if platform.system() == "Darwin"
-            else []
-        ),
-    )
+    # Resolve binaries up front and only spawn probes for tools that exist;
+    # the probes then run concurrently (max, not sum, of their latencies)
+    tools = [("node", "node"), ("npm", "npm")]
+    if _IS_DARWIN:
+        tools.append(("brew", "homebrew"))
+    probes = [
+        _check_tool(binary, path, key)
+        for binary, key in tools
+        if (path := _which(binary))
+    ]
+    await asyncio.gather(*probes)
 
     logger.info(f"Prerequisites: {result}")
+    _prereq_cache = (time.monotonic(), copy.deepcopy(result))
     return result
 
 
@@ -358,29 +630,85 @@ async def check_prerequisites() -> Dict[str, any]:
 # INSTALLATION — silent npm install
 # ═══════════════════════════════════════════════════════════════════
 
+_NPM_REGISTRY = "https://registry.npmjs.org"
+
+
+async def _latest_npm_version(package: str) -> Optional[str]:
+    """Look up a package's `latest` dist-tag straight from the npm registry.
+
+    Uses the abbreviated metadata document (a few hundred KB instead of
+    megabytes) and avoids forking `npm`. Returns None on any failure.
+    """
+    url = f"{_NPM_REGISTRY}/{urllib.parse.quote(package, safe='@')}"
+
+    def _fetch() -> Optional[str]:
+        req = urllib.request.Request(url, headers={
+            "Accept": "application/vnd.npm.install-v1+json",
+            "User-Agent": "Kiyomi/2.0",
+        })
+        with urllib.request.urlopen(req, timeout=10) as resp:
+            return json.loads(resp.read())["dist-tags"]["latest"]
+
+    try:
+        return await asyncio.to_thread(_fetch)
+    except Exception as e:
+        logger.debug(f"npm registry lookup for {package} failed: {e}")
+        return None
+
+
 async def _install_node_via_homebrew() -> dict:
     """Install Node.js via Homebrew silently."""
     logger.info("Installing Node.js via Homebrew...")
     brew_path = _which("brew")
     if not brew_path:
         return {"success": False, "error": "Homebrew not found"}
+    # Skip brew's implicit `brew update` (30–120 s fetching every tap);
+    # the local formula index is recent enough to install node.
+    env = _get_env()
+    env["HOMEBREW_NO_AUTO_UPDATE"] = "1"
     try:
-        proc = await asyncio.create_subprocess_exec(
-            brew_path, "install", "node",
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-            env=_get_env(),
-        )
-        stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=300)
-        if proc.returncode == 0:
+        returncode, _, stderr = await _run(brew_path, "install", "node", timeout=300, env=env)
+        if returncode == 0:
             logger.info("Node.js installed via Homebrew")
+            _invalidate_prerequisites()
+            _which_invalidate("node", "npm")
             return {"success": True}
         else:
-            return {"success": False, "error": stderr.decode()[:500]}
+            return {"success": False, "error": stderr[-500:]}
     except Exception as e:
         return {"success": False, "error": str(e)}
 
 
+async def _run_npm(
+    npm_path: str, *args: str, timeout: float = 120, keep_stdout: bool = False,
+) -> Tuple[int, str, str]:
+    """Run npm via _run() with a quiet, cache-friendly environment."""
+    env = _get_env()
+    env["NPM_CONFIG_PROGRESS"] = "false"  # no spinner redraws on the pipe
+    # Reuse cached metadata/tarballs (shared deps across the CLIs) without
+    # revalidating; versions are pinned, so a stale cache still refetches
+    env["NPM_CONFIG_PREFER_OFFLINE"] = "true"
+    return await _run(npm_path, *args, timeout=timeout, env=env, keep_stdout=keep_stdout)
+
+
+async def _ensure_node(steps: list) -> Optional[str]:
+    """Make sure Node.js is present, installing via Homebrew on macOS.
+
+    Appends progress to `steps`; returns an error message or None.
+    """
+    prereqs = await check_prerequisites()
+    if prereqs["node"]["available"]:
+        return None
+    if _IS_DARWIN and prereqs["homebrew"]["available"]:
+        steps.append("Installing Node.js via Homebrew")
+        node_result = await _install_node_via_homebrew()
+        if not node_result["success"]:
+            return f"Node.js install failed: {node_result.get('error', '?')}"
+        steps.append("Node.js installed")
+        return None
+    return "Node.js not found. Install from https://nodejs.org/"
+
+
 async def install_cli(provider: str) -> dict:
     """Install a CLI tool silently via npm.
 
@@ -389,67 +717,111 @@ async def install_cli(provider: str) -> dict:
         error (str|None): Error message if failed
         steps (list[str]): What was done
     """
-    if provider not in CLI_PACKAGES:
-        return {"success": False, "error": f"Unknown provider: {provider}", "steps": []}
+    return (await install_clis([provider]))[provider]
 
-    package = CLI_PACKAGES[provider]
-    steps = []
 
-    # Already installed?
-    if _which(provider):
-        return {"success": True, "steps": [f"{provider} already installed"], "error": None}
+async def install_clis(providers: list) -> Dict[str, dict]:
+    """Install several CLI tools with a single `npm install -g` run.
 
-    # Check prerequisites
-    prereqs = await check_prerequisites()
+    Saves npm's startup and metadata resolution for every package after
+    the first. If the combined install fails, each package is retried on
+    its own so one bad package doesn't sink the rest.
 
-    if not prereqs["node"]["available"]:
-        if prereqs["platform"] == "Darwin" and prereqs["homebrew"]["available"]:
-            steps.append("Installing Node.js via Homebrew")
-            node_result = await _install_node_via_homebrew()
-            if not node_result["success"]:
-                return {
-                    "success": False,
-                    "error": f"Node.js install failed: {node_result.get('error', '?')}",
-                    "steps": steps,
-                }
-            steps.append("Node.js installed")
+    Returns a dict keyed by provider, each shaped like install_cli()'s result.
+    """
+    results: Dict[str, dict] = {}
+    pending = []
+    for provider in dict.fromkeys(providers):
+        if provider not in CLI_PACKAGES:
+            results[provider] = {"success": False, "error": f"Unknown provider: {provider}", "steps": []}
+        elif _which(provider):
+            results[provider] = {"success": True, "steps": [f"{provider} already installed"], "error": None}
         else:
-            return {
-                "success": False,
-                "error": "Node.js not found. Install from https://nodejs.org/",
-                "steps": steps,
-            }
+            pending.append(provider)
+    if not pending:
+        return results
 
-    npm_path = _which("npm")
-    if not npm_path:
-        return {"success": False, "error": "npm not found after Node.js install", "steps": steps}
+    steps = []
+
+    # Pin versions up front so npm skips its own full-metadata fetch;
+    # the registry lookups overlap with any prerequisite work below
+    version_tasks = {
+        provider: asyncio.create_task(_latest_npm_version(CLI_PACKAGES[provider]))
+        for provider in pending
+    }
 
-    # Install the CLI package globally
-    steps.append(f"Installing {package}")
-    logger.info(f"npm install -g {package}")
+    # Node and npm already on PATH — no need to probe or install anything
+    npm_path = _which("npm")
+    if not (npm_path and _which("node")):
+        error = await _ensure_node(steps)
+        npm_path = _which("npm")
+        if error or not npm_path:
+            for task in version_tasks.values():
+                task.cancel()
+            error = error or "npm not found after Node.js install"
+            for provider in pending:
+                results[provider] = {"success": False, "error": error, "steps": list(steps)}
+            return results
+
+    specs = {}
+    for provider, task in version_tasks.items():
+        package = CLI_PACKAGES[provider]
+        version = await task
+        specs[provider] = f"{package}@{version}" if version else package
+
+    # Install the CLI packages globally
+    steps.append(f"Installing {', '.join(specs.values())}")
+    logger.info(f"npm install -g {' '.join(specs.values())}")
 
     try:
-        proc = await asyncio.create_subprocess_exec(
-            npm_path, "install", "-g", package,
-            stdout=asyncio.subprocess.PIPE,
-            stderr=asyncio.subprocess.PIPE,
-            env=_get_env(),
+        # --json keeps stdout to one small summary object; skipping the
+        # audit and funding lookups saves npm two registry round trips
+        returncode, stdout, stderr = await _run_npm(
+            npm_path, "install", "-g", "--json", "--no-audit", "--no-fund",
+            *specs.values(), timeout=120 * len(specs), keep_stdout=True,
         )
-        stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout=120)
-
-        if proc.returncode == 0:
-            steps.append(f"{provider} CLI installed")
-            logger.info(f"{provider} CLI installed successfully")
-            return {"success": True, "steps": steps, "error": None}
+        try:
+            summary = json.loads(stdout) if stdout else {}
+        except ValueError:
+            logger.debug("npm --json output was not valid JSON")
+            summary = {}
+        if not isinstance(summary, dict):
+            summary = {}
+        if returncode == 0:
+            error = None
+            logger.info(f"npm added {summary.get('added', '?')} packages")
         else:
-            err = stderr.decode()[:500]
-            logger.error(f"npm install {package} failed: {err}")
-            return {"success": False, "error": f"npm install failed: {err}", "steps": steps}
-
+            npm_error = summary.get("error")
+            if not isinstance(npm_error, dict):
+                npm_error = {}
+            # npm's own summary if it gave one, else the end of stderr
+            # (where the actual error is; the start is warnings/progress)
+            err = str(npm_error.get("summary") or "")[:500] or stderr[-500:]
+            logger.error(f"npm install {' '.join(specs.values())} failed: {err}")
+            error = f"npm install failed: {err}"
     except asyncio.TimeoutError:
-        return {"success": False, "error": "npm install timed out", "steps": steps}
+        error = "npm install timed out"
     except Exception as e:
-        return {"success": False, "error": str(e), "steps": steps}
+        error = str(e)
+
+    if error and len(pending) > 1:
+        logger.info("Combined npm install failed, retrying packages one at a time")
+        for provider in pending:
+            results.update(await install_clis([provider]))
+        return results
+
+    for provider in pending:
+        if error:
+            results[provider] = {"success": False, "error": error, "steps": list(steps)}
+        else:
+            logger.info(f"{provider} CLI installed successfully")
+            _which_invalidate(provider)
+            results[provider] = {
+                "success": True,
+                "steps": steps + [f"{provider} CLI installed"],
+                "error": None,
+            }
+    return results
 
 
 # ═══════════════════════════════════════════════════════════════════
@@ -504,10 +876,10 @@ async def auto_setup(provider: str) -> dict:
 
     # Step 3: Need auth — trigger browser OAuth
     result["needs_auth"] = True
-    cfg = AUTH_CONFIG.get(provider, {})
+    cfg = AUTH_CONFIG.get(provider)
     result["summary"] = (
-        f"{cfg.get('display_name', provider)} CLI installed. "
-        f"Sign in with your {cfg.get('subscription', 'subscription')} to activate."
+        f"{cfg.display_name if cfg else provider} CLI installed. "
+        f"Sign in with your {cfg.subscription if cfg else 'subscription'} to activate."
     )
 
     return result
@@ -532,31 +904,48 @@ def detect_all() -> dict:
             ...
         }
     """
-    status = {}
-    for provider in CLI_PACKAGES:
-        cli_path = check_cli_installed(provider)
-        auth = check_cli_auth(provider) if cli_path else {
-            "authenticated": False,
-            "subscription": None,
-            "account": None,
-            "detail": "Not installed",
-        }
-        status[provider] = {
-            "installed": bool(cli_path),
-            "path": cli_path,
-            "authenticated": auth["authenticated"],
-            "subscription": auth["subscription"],
-            "account": auth["account"],
-            "detail": auth["detail"],
-        }
-    return status
+    return {provider: _provider_status(provider) for provider in CLI_PACKAGES}
+
+
+def _provider_status(provider: str) -> dict:
+    """One provider's entry in detect_all()."""
+    cli_path = check_cli_installed(provider)
+    auth = _auth_status(provider) if cli_path else {
+        "authenticated": False,
+        "subscription": None,
+        "account": None,
+        "detail": "Not installed",
+    }
+    return {
+        "installed": bool(cli_path),
+        "path": cli_path,
+        "authenticated": auth["authenticated"],
+        "subscription": auth["subscription"],
+        "account": auth["account"],
+        "detail": auth["detail"],
+    }
+
+
+async def detect_all_async() -> dict:
+    """detect_all() with each provider's PATH lookup and auth read in its own thread.
+
+    Overlaps the stat/read latency, which matters on slow or network filesystems.
+    """
+    statuses = await asyncio.gather(
+        *(asyncio.to_thread(_provider_status, provider) for provider in CLI_PACKAGES)
+    )
+    return dict(zip(CLI_PACKAGES, statuses))
 
 
 async def get_installation_status() -> dict:
     """Get full installation/auth status (async version with prereqs)."""
+    prerequisites, providers = await asyncio.gather(
+        check_prerequisites(),
+        detect_all_async(),
+    )
     return {
-        "prerequisites": await check_prerequisites(),
-        "providers": detect_all(),
+        "prerequisites": prerequisites,
+        "providers": providers,
     }
 
 
@@ -573,23 +962,21 @@ def get_subscription_info() -> list:
     """Get subscription info for onboarding UI display."""
     return [
         {
-            "provider": provider,
-            "display_name": cfg["display_name"],
-            "subscription": cfg["subscription"],
-            "installed": bool(_which(provider)),
-            "authenticated": check_cli_auth(provider)["authenticated"],
+            **tpl,
+            "installed": bool(_which(tpl["provider"])),
+            "authenticated": check_cli_auth_bool(tpl["provider"]),
         }
-        for provider, cfg in AUTH_CONFIG.items()
+        for tpl in _SUB_INFO_TEMPLATE
     ]
 
 
 def get_best_provider() -> Optional[str]:
     """Detect the best available & authenticated CLI provider.
 
-    Priority: claude > gemini > codex (matches router.py preference order).
+    Priority: PROVIDER_PRIORITY (claude > gemini > codex).
     Returns provider name string or None.
     """
-    for provider in ["claude", "gemini", "codex"]:
+    for provider in PROVIDER_PRIORITY:
         path = check_cli_installed(provider)
         if path and check_cli_auth_bool(provider):
             return provider
@@ -10,9 +10,11 @@ Auth is validated before execution. Errors are caught and returned cleanly.
 import asyncio
 import logging
 import os
+import re
 import shutil
+import time
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -21,6 +23,16 @@ DEFAULT_TIMEOUT = 300  # 5 minutes
 
 # Workspace for created files
 WORKSPACE = Path.home() / ".kiyomi" / "workspace"
+_workspace_ready = False  # created once per process, by the first router
+
+# How long a passed install/auth pre-flight check is trusted per router
+READY_TTL = 30  # seconds
+
+# CLI error output that means the user is signed out
+_AUTH_ERROR_RE = re.compile(
+    r"not (?:logged in|authenticated)|unauthenticated|unauthori[sz]ed|please (?:log ?in|sign in)|invalid api key",
+    re.IGNORECASE,
+)
 
 
 class CLIRouter:
@@ -28,7 +40,12 @@ class CLIRouter:
 
     def __init__(self, timeout: int = DEFAULT_TIMEOUT):
         self.timeout = timeout
-        WORKSPACE.mkdir(parents=True, exist_ok=True)
+        self._env: Optional[dict] = None
+        self._ready: Dict[Tuple[str, str], float] = {}  # (provider, cmd) -> last passed pre-flight
+        global _workspace_ready
+        if not _workspace_ready:
+            WORKSPACE.mkdir(parents=True, exist_ok=True)
+            _workspace_ready = True
 
     async def chat(
         self,
@@ -57,23 +74,27 @@ class CLIRouter:
 
         provider = provider.lower().replace("-cli", "")
 
+        # Locate the binary and validate auth via config files (cached, no
+        # subprocess); once that passes, trust it for READY_TTL
         cmd = cli_path or provider
-        if not self.check_cli_available(cmd):
-            return (
-                f"{provider.title()} CLI not found. "
-                f"Kiyomi can install it automatically — check Settings."
-            )
-
-        # Validate auth via config files (fast, no subprocess)
-        try:
-            from engine.cli_installer import check_cli_auth_bool
-            if not check_cli_auth_bool(provider):
+        if time.monotonic() - self._ready.get((provider, cmd), float("-inf")) > READY_TTL:
+            try:
+                from engine.cli_installer import probe
+                path, authed = probe(provider, cmd)
+            except ImportError:
+                path, authed = self._which(cmd), True
+
+            if not path:
+                return (
+                    f"{provider.title()} CLI not found. "
+                    f"Kiyomi can install it automatically — check Settings."
+                )
+            if not authed:
                 return (
                     f"{provider.title()} CLI is installed but not authenticated. "
                     f"Please sign in through Settings to connect your subscription."
                 )
-        except ImportError:
-            pass
+            self._ready[(provider, cmd)] = time.monotonic()
 
         try:
             if provider == "claude":
@@ -103,9 +124,6 @@ class CLIRouter:
             --system-prompt             Separate system instructions
         """
         cmd = cli_path or "claude"
-        if not self.check_cli_available(cmd):
-            return "Claude CLI not found."
-
         args = [
             cmd, "-p", message,
             "--output-format", "text",
@@ -130,9 +148,6 @@ class CLIRouter:
             --skip-git-repo-check                   Works outside git repos
         """
         cmd = cli_path or "codex"
-        if not self.check_cli_available(cmd):
-            return "Codex CLI not found."
-
         # Codex has no --system-prompt; prepend to message
         full_message = message
         if system_prompt:
@@ -160,9 +175,6 @@ class CLIRouter:
             -o text         Clean text output
         """
         cmd = cli_path or "gemini"
-        if not self.check_cli_available(cmd):
-            return "Gemini CLI not found."
-
         # Gemini has no --system-prompt; prepend to message
         full_message = message
         if system_prompt:
@@ -197,6 +209,9 @@ class CLIRouter:
                 error_msg = stderr.decode("utf-8", errors="replace").strip()
                 # Some CLIs write useful output to stdout even on non-zero exit
                 fallback = stdout.decode("utf-8", errors="replace").strip()
+                if _AUTH_ERROR_RE.search(error_msg or fallback):
+                    # Signed out since the pre-flight check — re-check next time
+                    self._forget_ready(label.lower())
                 if fallback and not error_msg:
                     return fallback
                 return f"{label} CLI error: {error_msg[:300]}"
@@ -204,13 +219,31 @@ class CLIRouter:
             response = stdout.decode("utf-8", errors="replace").strip()
             return response or f"No response from {label} CLI."
 
+        except FileNotFoundError:
+            # Removed since the pre-flight check — look it up again next time
+            self._forget_ready(label.lower())
+            return f"{label} CLI not found."
         except asyncio.TimeoutError:
             return f"{label} CLI request timed out after {self.timeout} seconds."
         except Exception as e:
             return f"{label} CLI execution error: {str(e)[:200]}"
 
     def _get_env(self) -> dict:
-        """Build environment with PATH covering common CLI install locations."""
+        """Environment with PATH covering common CLI install locations.
+
+        Built once per router; subprocess spawning only reads it, so the
+        same dict is handed out every time — don't mutate it.
+        """
+        if self._env is None:
+            self._env = self._build_env()
+        return self._env
+
+    def _build_env(self) -> dict:
+        try:
+            from engine.cli_installer import get_cli_env
+            return get_cli_env()
+        except ImportError:
+            pass
         env = os.environ.copy()
         extra_paths = [
             "/usr/local/bin",
@@ -219,25 +252,36 @@ class CLIRouter:
             str(Path.home() / ".npm-global" / "bin"),
             str(Path.home() / ".cargo" / "bin"),
         ]
-        existing = env.get("PATH", "")
-        for p in extra_paths:
-            if p not in existing:
-                existing = f"{p}:{existing}"
-        env["PATH"] = existing
+        entries = list(dict.fromkeys(p for p in env.get("PATH", "").split(os.pathsep) if p))
+        present = set(entries)
+        missing = [p for p in reversed(extra_paths) if p not in present]
+        env["PATH"] = os.pathsep.join(missing + entries)
         return env
 
     # ── Utilities ─────────────────────────────────────────────────────
 
+    def _forget_ready(self, provider: str):
+        """Drop cached pre-flight passes for a provider."""
+        for key in [k for k in self._ready if k[0] == provider]:
+            del self._ready[key]
+
+    def _which(self, cli_name: str) -> Optional[str]:
+        """Locate a CLI, sharing cli_installer's cached lookups when available."""
+        try:
+            from engine.cli_installer import check_cli_installed
+        except ImportError:
+            return shutil.which(cli_name, path=self._get_env()["PATH"])
+        return check_cli_installed(cli_name)
+
     def check_cli_available(self, cli_name: str) -> bool:
         """Check if CLI tool is available in expanded PATH."""
-        return shutil.which(cli_name, path=self._get_env()["PATH"]) is not None
+        return self._which(cli_name) is not None
 
     def get_available_clis(self) -> dict:
         """Get dict of available CLI tools and their paths."""
-        expanded = self._get_env()["PATH"]
         clis = {}
         for name in ["claude", "codex", "gemini"]:
-            path = shutil.which(name, path=expanded)
+            path = self._which(name)
             if path:
                 clis[name] = path
         return clis
@@ -58,6 +58,20 @@ NON_COMPUTER_PATTERNS = [
     r"why\s+is",
 ]
 
+# Every COMPUTER_ACTION_PATTERNS entry contains at least one of these words
+# literally, so a message with none of them can't match — keep in sync.
+_COMPUTER_TRIGGERS = frozenset({
+    "open", "launch", "switch", "start", "click", "press", "fill", "type",
+    "select", "choose", "go", "search", "book", "order", "change",
+    "screenshot", "show", "computer", "automate",
+})
+
+# Each list fused into one alternation, compiled once: a single C-level
+# scan per message instead of a Python loop of searches. Named groups
+# (p0, p1, ...) let the log say which pattern fired.
+_COMPUTER_RE = re.compile("|".join(f"(?P<p{i}>{p})" for i, p in enumerate(COMPUTER_ACTION_PATTERNS)))
+_NON_COMPUTER_RE = re.compile("|".join(f"(?:{p})" for p in NON_COMPUTER_PATTERNS))
+
 
 def is_computer_action(message: str) -> bool:
     """
@@ -74,16 +88,20 @@ def is_computer_action(message: str) -> bool:
     
     message_lower = message.lower().strip()
     
+    # Cheap substring prefilter: most messages have no action word at all
+    if not any(trigger in message_lower for trigger in _COMPUTER_TRIGGERS):
+        return False
+    
     # First check for explicit non-computer patterns
-    for pattern in NON_COMPUTER_PATTERNS:
-        if re.search(pattern, message_lower):
-            return False
+    if _NON_COMPUTER_RE.search(message_lower):
+        return False
     
     # Then check for computer action patterns
-    for pattern in COMPUTER_ACTION_PATTERNS:
-        if re.search(pattern, message_lower):
-            logger.info(f"Computer action detected: pattern '{pattern}' matched '{message[:100]}...'")
-            return True
+    match = _COMPUTER_RE.search(message_lower)
+    if match:
+        pattern = COMPUTER_ACTION_PATTERNS[int(match.lastgroup[1:])]
+        logger.info(f"Computer action detected: pattern '{pattern}' matched '{message[:100]}...'")
+        return True
     
     return False
 
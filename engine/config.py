@@ -4,12 +4,19 @@ All config lives in ~/.kiyomi/config.json
 """
 import json
 from pathlib import Path
+from typing import Any, Optional
+
+try:
+    import orjson  # Optional C JSON codec — stdlib json is the fallback
+except ImportError:
+    orjson = None
 
 CONFIG_DIR = Path.home() / ".kiyomi"
 CONFIG_FILE = CONFIG_DIR / "config.json"
 MEMORY_DIR = CONFIG_DIR / "memory"
 SKILLS_DIR = CONFIG_DIR / "skills"
 LOGS_DIR = CONFIG_DIR / "logs"
+FILES_DIR = CONFIG_DIR / "files"
 
 # Defaults
 DEFAULT_CONFIG = {
@@ -36,40 +43,113 @@ DEFAULT_CONFIG = {
 }
 
 
+def loads_json(data: bytes) -> Any:
+    """Parse JSON bytes, using orjson when it's installed."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def dumps_json(obj: Any) -> bytes:
+    """Serialize `obj` as 2-space-indented UTF-8 JSON bytes."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode("utf-8")
+
+
 def ensure_dirs():
     """Create all required directories."""
-    for d in [CONFIG_DIR, MEMORY_DIR, SKILLS_DIR, LOGS_DIR]:
+    for d in [CONFIG_DIR, MEMORY_DIR, SKILLS_DIR, LOGS_DIR, FILES_DIR]:
         d.mkdir(parents=True, exist_ok=True)
 
 
-def load_config() -> dict:
-    """Load config from ~/.kiyomi/config.json."""
+# Parsed config keyed by (st_mtime_ns, st_size) of CONFIG_FILE
+_config_cache: Optional[tuple[tuple[int, int], dict]] = None
+
+
+def _config_stamp() -> Optional[tuple[int, int]]:
+    """Return the mtime/size stamp of CONFIG_FILE, or None if missing."""
+    try:
+        st = CONFIG_FILE.stat()
+    except FileNotFoundError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _cached_config() -> dict:
+    """Return the shared parsed config, re-reading only when the file changes.
+
+    The returned dict is the cache itself — never mutate it.
+    """
+    global _config_cache
+    stamp = _config_stamp()
+    if stamp is None:
+        ensure_dirs()
+        return DEFAULT_CONFIG
+    if _config_cache is not None and _config_cache[0] == stamp:
+        return _config_cache[1]
+
     ensure_dirs()
-    if CONFIG_FILE.exists():
-        with open(CONFIG_FILE) as f:
-            stored = json.load(f)
-            # Merge with defaults (adds any new keys)
-            config = {**DEFAULT_CONFIG, **stored}
-            return config
-    return DEFAULT_CONFIG.copy()
+    stored = loads_json(CONFIG_FILE.read_bytes())
+    # Merge with defaults (adds any new keys)
+    config = {**DEFAULT_CONFIG, **stored}
+    _config_cache = (stamp, config)
+    return config
+
+
+def load_config() -> dict:
+    """Load config from ~/.kiyomi/config.json.
+
+    The parsed file is cached until its mtime/size changes, so repeated
+    calls cost one stat(). Callers get their own shallow copy.
+    """
+    return dict(_cached_config())
+
+
+def get_config_value(key: str, default: Any = None) -> Any:
+    """Read one config setting without copying the whole config."""
+    return _cached_config().get(key, default)
 
 
 def save_config(config: dict):
     """Save config to ~/.kiyomi/config.json."""
+    global _config_cache
     ensure_dirs()
-    with open(CONFIG_FILE, "w") as f:
-        json.dump(config, f, indent=2)
+    CONFIG_FILE.write_bytes(dumps_json(config))
+    # Prime the cache with what we just wrote
+    stamp = _config_stamp()
+    _config_cache = (stamp, {**DEFAULT_CONFIG, **config}) if stamp else None
+
+
+# Config key that stores each API provider's key
+PROVIDER_KEYS = {
+    "gemini": "gemini_key",
+    "anthropic": "anthropic_key",
+    "openai": "openai_key",
+}
 
 
 def get_api_key(config: dict) -> str:
     """Get the active API key based on provider."""
     provider = config.get("provider", "gemini")
-    key_map = {
-        "gemini": "gemini_key",
-        "anthropic": "anthropic_key",
-        "openai": "openai_key",
-    }
-    return config.get(key_map.get(provider, "gemini_key"), "")
+    return config.get(PROVIDER_KEYS.get(provider, "gemini_key"), "")
+
+
+def get_provider_key(config: dict, provider: str) -> str:
+    """Get the API key for a specific provider, falling back to the active one."""
+    return config.get(PROVIDER_KEYS.get(provider, ""), "") or get_api_key(config)
+
+
+def get_plaid_creds(config: Optional[dict] = None) -> tuple[str, str, str]:
+    """Return (client_id, secret, env) for Plaid from the (cached) config."""
+    if config is None:
+        config = load_config()
+    plaid_cfg = config.get("plaid") or {}
+    return (
+        plaid_cfg.get("client_id", ""),
+        plaid_cfg.get("secret", ""),
+        plaid_cfg.get("env", "sandbox"),
+    )
 
 
 def get_model(config: dict) -> str:
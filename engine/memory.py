@@ -6,7 +6,9 @@ Memory is organized by category. Every meaningful fact gets saved,
 deduplicated, and recalled. This is Kiyomi's core product.
 """
 import difflib
+import functools
 import logging
+import os
 import re
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -118,6 +120,48 @@ _p(r"(?:our |my )anniversary is (.+?)(?:\.|$)", "schedule", "Anniversary: {0}")
 
 # ── Core functions ──────────────────────────────────────────
 
+_TIMESTAMP_PREFIX = re.compile(r"^\[\d{4}-\d{2}-\d{2} \d{2}:\d{2}\] ")
+
+# Parsed fact text per category file: path -> ((mtime_ns, size), facts)
+_fact_cache: dict[Path, tuple[tuple[int, int], list[str]]] = {}
+
+
+def _file_stamp(path: Path) -> Optional[tuple[int, int]]:
+    """Return (mtime_ns, size) for a file, or None if it doesn't exist."""
+    try:
+        st = path.stat()
+    except FileNotFoundError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _read_facts(filepath: Path) -> list[str]:
+    """Return fact texts (without "- " and timestamp) from a category file.
+
+    Parsed results are kept in memory and only re-read when the file's
+    mtime/size changes, so repeated saves don't re-parse the whole file.
+    """
+    stamp = _file_stamp(filepath)
+    if stamp is None:
+        _fact_cache.pop(filepath, None)
+        return []
+    cached = _fact_cache.get(filepath)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+
+    facts = []
+    content = filepath.read_text(encoding="utf-8", errors="replace")
+    for line in content.splitlines():
+        stripped = line.strip()
+        if stripped.startswith("- "):
+            # Remove "- " prefix, then remove "[YYYY-MM-DD HH:MM] " timestamp
+            fact_text = _TIMESTAMP_PREFIX.sub("", stripped[2:]).strip()
+            if fact_text:
+                facts.append(fact_text)
+    _fact_cache[filepath] = (stamp, facts)
+    return facts
+
+
 def save_fact(fact: str, category: str, user_dir: Optional[Path] = None) -> bool:
     """Save a fact to the appropriate category file.
     Returns False if duplicate (>80% similar to existing fact).
@@ -142,20 +186,8 @@ def save_fact(fact: str, category: str, user_dir: Optional[Path] = None) -> bool
     filepath = memory_dir / filename
     memory_dir.mkdir(parents=True, exist_ok=True)
 
-    # Load existing facts
-    existing_facts = []
-    if filepath.exists():
-        content = filepath.read_text(encoding="utf-8", errors="replace")
-        for line in content.splitlines():
-            stripped = line.strip()
-            if stripped.startswith("- "):
-                # Remove "- " prefix, then remove "[YYYY-MM-DD HH:MM] " timestamp
-                fact_text = stripped[2:]
-                fact_text = re.sub(r"^\[\d{4}-\d{2}-\d{2} \d{2}:\d{2}\] ", "", fact_text).strip()
-                if fact_text:
-                    existing_facts.append(fact_text)
-    else:
-        content = f"# {display_name}\n\n"
+    # Load existing facts (cached until the file changes)
+    existing_facts = _read_facts(filepath)
 
     # Check for duplicates using SequenceMatcher
     fact_lower = fact.lower()
@@ -165,34 +197,122 @@ def save_fact(fact: str, category: str, user_dir: Optional[Path] = None) -> bool
             logger.debug(f"Duplicate fact skipped (ratio={ratio:.2f}): {fact[:60]}")
             return False
 
-    # Append the new fact
+    # Append the new fact — no need to rewrite the whole file
     timestamp = datetime.now().strftime("%Y-%m-%d %H:%M")
     new_line = f"- [{timestamp}] {fact}\n"
 
-    if not content.endswith("\n"):
-        content += "\n"
-    content += new_line
-
-    filepath.write_text(content, encoding="utf-8")
+    with open(filepath, "a+b") as f:
+        if f.seek(0, os.SEEK_END) == 0:
+            f.write(f"# {display_name}\n\n".encode("utf-8"))
+        else:
+            f.seek(-1, os.SEEK_END)
+            if f.read(1) != b"\n":
+                f.write(b"\n")
+        f.write(new_line.encode("utf-8"))
+
+    stamp = _file_stamp(filepath)
+    if stamp is not None:
+        _fact_cache[filepath] = (stamp, existing_facts + [fact])
     logger.info(f"Saved fact to {category}: {fact[:60]}")
     return True
 
 
+# Upper bound on the memory block injected into every system prompt
+MEMORY_PROMPT_MAX_CHARS = 8000
+
+
+def _tail_within(text: str, limit: int) -> str:
+    """Return the last whole lines of `text` that fit in `limit` chars."""
+    if len(text) <= limit:
+        return text
+    cut = text[-limit:] if limit > 0 else ""
+    newline = cut.find("\n")
+    return cut[newline + 1:] if newline != -1 else cut
+
+
+def _memory_stamps(memory_dir: Path) -> tuple:
+    """Stat the facts, profile and documents — the cache key for their block.
+
+    Conversation logs are left out: they change every turn and are cheap to
+    tail, so load_all_memory reads them fresh instead.
+    """
+    stamps = []
+    for cat_key in LOAD_PRIORITY:
+        stamps.append(_file_stamp(memory_dir / CATEGORIES[cat_key][0]))
+    stamps.append(_file_stamp(memory_dir / "profile.md"))
+    try:
+        docs = sorted(
+            (f.name, _file_stamp(f))
+            for f in (memory_dir / "documents").iterdir() if f.suffix == ".md"
+        )
+    except FileNotFoundError:
+        docs = []
+    stamps.append(tuple(docs))
+    return tuple(stamps)
+
+
+def _tail_chars(path: Path, n: int) -> str:
+    """Return roughly the last `n` characters of a UTF-8 file without reading it all."""
+    with open(path, "rb") as f:
+        f.seek(0, os.SEEK_END)
+        size = f.tell()
+        # 4 bytes per char at most, plus room for a split leading character
+        f.seek(max(0, size - (4 * n + 3)))
+        data = f.read()
+    text = data.decode("utf-8", errors="replace").replace("\r\n", "\n")
+    return text[-n:] if n > 0 else ""
+
+
 def load_all_memory(user_dir: Optional[Path] = None) -> str:
     """Load ALL memory for system prompt injection.
     
     Returns formatted string with section headers.
-    Capped at 8000 chars. Prioritized by importance.
+    Capped at MEMORY_PROMPT_MAX_CHARS, prioritized by importance, keeping
+    the most recent facts of each category. The facts/profile/documents
+    part is cached until one of those files changes; the conversation
+    tail is re-read each call.
     
     Args:
         user_dir: Optional user-specific memory directory. If None, uses default MEMORY_DIR.
     """
     # Use user-specific directory or default
     memory_dir = user_dir if user_dir is not None else MEMORY_DIR
-    memory_dir.mkdir(parents=True, exist_ok=True)
+    today = datetime.now()
+    day_names = tuple((today - timedelta(days=i)).strftime("%Y-%m-%d") for i in range(2))
+    cached_sections, total_chars = _build_memory_block(memory_dir, _memory_stamps(memory_dir))
+    sections = list(cached_sections)
+    max_chars = MEMORY_PROMPT_MAX_CHARS
+
+    # 4. Recent conversations (last 2 days)
+    convos_dir = memory_dir / "conversations"
+    if total_chars < max_chars:
+        for i, day_name in enumerate(day_names):
+            if total_chars >= max_chars:
+                break
+            day_file = convos_dir / f"{day_name}.md"
+            try:
+                remaining = max_chars - total_chars
+                # Take last N chars to get most recent conversations
+                truncated = _tail_chars(day_file, min(800, remaining))
+            except FileNotFoundError:
+                continue
+            label = "Today" if i == 0 else "Yesterday"
+            sections.append(f"**Recent ({label}):**\n{truncated}")
+            total_chars += len(truncated) + 20
+
+    return "\n\n".join(sections) if sections else ""
+
+
+@functools.lru_cache(maxsize=16)
+def _build_memory_block(memory_dir: Path, stamps: tuple) -> tuple[tuple[str, ...], int]:
+    """Read and format the facts, profile and documents sections.
+
+    Returns (sections, chars used). `stamps` is only part of the cache key;
+    it isn't read here.
+    """
     sections: list[str] = []
     total_chars = 0
-    max_chars = 8000
+    max_chars = MEMORY_PROMPT_MAX_CHARS
 
     # 1. Category files (in priority order)
     for cat_key in LOAD_PRIORITY:
@@ -208,7 +328,8 @@ def load_all_memory(user_dir: Optional[Path] = None) -> str:
                 body = "\n".join(l for l in lines if not l.startswith("# ")).strip()
                 if body:
                     remaining = max_chars - total_chars
-                    section = f"**{display_name}:**\n{body[:remaining]}"
+                    # Newest facts are at the bottom — keep those when trimming
+                    section = f"**{display_name}:**\n{_tail_within(body, remaining)}"
                     sections.append(section)
                     total_chars += len(section)
 
@@ -239,25 +360,42 @@ def load_all_memory(user_dir: Optional[Path] = None) -> str:
                 sections.append(f"**Saved Document ({doc_file.stem}):**\n{truncated}")
                 total_chars += len(truncated) + 30
 
-    # 4. Recent conversations (last 2 days)
-    convos_dir = memory_dir / "conversations"
-    if convos_dir.exists() and total_chars < max_chars:
-        today = datetime.now()
-        for i in range(2):
-            if total_chars >= max_chars:
-                break
-            day = today - timedelta(days=i)
-            day_file = convos_dir / f"{day.strftime('%Y-%m-%d')}.md"
-            if day_file.exists():
-                content = day_file.read_text(encoding="utf-8", errors="replace")
-                remaining = max_chars - total_chars
-                # Take last N chars to get most recent conversations
-                truncated = content[-min(800, remaining):]
-                label = "Today" if i == 0 else "Yesterday"
-                sections.append(f"**Recent ({label}):**\n{truncated}")
-                total_chars += len(truncated) + 20
+    return tuple(sections), total_chars
 
-    return "\n\n".join(sections) if sections else ""
+
+def tail_lines(path: Path, n: int, blocksize: int = 4096) -> list[str]:
+    """Return the last `n` fact lines ("- ...") of a memory file.
+
+    Reads backwards from the end of the file in blocks instead of loading
+    the whole thing, so large category files stay cheap to preview.
+    Falls back to a full read when the file is smaller than one block.
+    """
+    if n <= 0:
+        return []
+    size = os.path.getsize(path)
+    if size <= blocksize:
+        content = path.read_text(encoding="utf-8", errors="replace")
+        facts = [l.strip() for l in content.splitlines() if l.strip().startswith("- ")]
+        return facts[-n:]
+
+    with open(path, "rb") as f:
+        offset = size
+        data = b""
+        while True:
+            read_size = min(blocksize, offset)
+            offset -= read_size
+            f.seek(offset)
+            data = f.read(read_size) + data
+            lines = data.splitlines()
+            # The first line may be cut mid-way unless we reached the start
+            if offset > 0:
+                lines = lines[1:]
+            facts = [
+                s for s in (l.decode("utf-8", errors="replace").strip() for l in lines)
+                if s.startswith("- ")
+            ]
+            if len(facts) >= n or offset == 0:
+                return facts[-n:]
 
 
 def load_category(category: str) -> str:
@@ -23,6 +23,26 @@ class UserManager:
     
     def __init__(self):
         self._users_cache: Optional[Dict] = None
+        # telegram_id -> user dict / resolved memory dir
+        self._by_telegram_id: Dict[str, Dict] = {}
+        self._memory_dirs: Dict[str, Path] = {}
+    
+    def _find_user(self, telegram_id: str) -> Optional[Dict]:
+        """Look up a user by Telegram ID via the in-memory index."""
+        if self._users_cache is None:
+            self._load_users()
+        return self._by_telegram_id.get(telegram_id)
+    
+    def _index_users(self, data: Dict):
+        """Rebuild the telegram_id index after loading/saving users."""
+        self._by_telegram_id = {
+            u.get("telegram_id"): u for u in data.get("users", [])
+        }
+        self._memory_dirs.clear()
+    
+    def invalidate(self, telegram_id: str):
+        """Drop cached lookups for a user (e.g. after their memory is wiped)."""
+        self._memory_dirs.pop(telegram_id, None)
     
     def _load_users(self) -> Dict:
         """Load users from users.json file."""
@@ -36,6 +56,7 @@ class UserManager:
                 with open(USERS_FILE, 'r', encoding='utf-8') as f:
                     data = json.load(f)
                     self._users_cache = data
+                    self._index_users(data)
                     return data
             except (json.JSONDecodeError, IOError) as e:
                 logger.warning(f"Failed to load users.json: {e}")
@@ -43,6 +64,7 @@ class UserManager:
         # Create default structure
         default_data = {"users": []}
         self._users_cache = default_data
+        self._index_users(default_data)
         return default_data
     
     def _save_users(self, data: Dict):
@@ -52,6 +74,7 @@ class UserManager:
             with open(USERS_FILE, 'w', encoding='utf-8') as f:
                 json.dump(data, f, indent=2, ensure_ascii=False)
             self._users_cache = data
+            self._index_users(data)
             logger.info(f"Saved {len(data.get('users', []))} users to {USERS_FILE}")
         except IOError as e:
             logger.error(f"Failed to save users.json: {e}")
@@ -59,12 +82,11 @@ class UserManager:
     
     def get_or_create_user(self, telegram_id: str, first_name: str) -> Dict:
         """Get existing user or create a new one. Auto-creates on first message."""
-        data = self._load_users()
-        
         # Look for existing user
-        for user in data.get("users", []):
-            if user.get("telegram_id") == telegram_id:
-                return user
+        user = self._find_user(telegram_id)
+        if user is not None:
+            return user
+        data = self._load_users()
         
         # Create new user
         user_id = f"user_{len(data.get('users', [])) + 1}_{telegram_id}"
@@ -96,14 +118,16 @@ class UserManager:
     
     def get_user_memory_dir(self, telegram_id: str) -> Optional[Path]:
         """Get the memory directory path for a user."""
-        data = self._load_users()
-        
-        for user in data.get("users", []):
-            if user.get("telegram_id") == telegram_id:
-                memory_subdir = user.get("memory_dir", DEFAULT_MEMORY_SUBDIR)
-                return CONFIG_DIR / memory_subdir
-        
-        return None
+        memory_dir = self._memory_dirs.get(telegram_id)
+        if memory_dir is not None:
+            return memory_dir
+        
+        user = self._find_user(telegram_id)
+        if user is None:
+            return None
+        memory_dir = CONFIG_DIR / user.get("memory_dir", DEFAULT_MEMORY_SUBDIR)
+        self._memory_dirs[telegram_id] = memory_dir
+        return memory_dir
     
     def list_users(self) -> List[Dict]:
         """Return all registered users."""
@@ -112,37 +136,23 @@ class UserManager:
     
     def switch_user(self, telegram_id: str) -> Optional[Dict]:
         """Switch to a different user (admin function). Returns user data if found."""
-        data = self._load_users()
-        
-        for user in data.get("users", []):
-            if user.get("telegram_id") == telegram_id:
-                return user
-        
-        return None
+        return self._find_user(telegram_id)
     
     def get_user_by_telegram_id(self, telegram_id: str) -> Optional[Dict]:
         """Get user data by Telegram ID."""
-        data = self._load_users()
-        
-        for user in data.get("users", []):
-            if user.get("telegram_id") == telegram_id:
-                return user
-        
-        return None
+        return self._find_user(telegram_id)
     
     def update_user(self, telegram_id: str, updates: Dict) -> bool:
         """Update user data. Returns True if successful."""
-        data = self._load_users()
-        
-        for user in data.get("users", []):
-            if user.get("telegram_id") == telegram_id:
-                user.update(updates)
-                user["updated_at"] = datetime.now().isoformat()
-                self._save_users(data)
-                logger.info(f"Updated user {telegram_id}: {updates}")
-                return True
-        
-        return False
+        user = self._find_user(telegram_id)
+        if user is None:
+            return False
+        
+        user.update(updates)
+        user["updated_at"] = datetime.now().isoformat()
+        self._save_users(self._load_users())
+        logger.info(f"Updated user {telegram_id}: {updates}")
+        return True
     
     def get_stats(self) -> Dict:
         """Get user statistics."""
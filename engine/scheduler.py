@@ -25,6 +25,7 @@ FOLLOW_UP_KEYWORDS = [
 ]
 
 MEMORY_DIR = Path.home() / ".kiyomi" / "memory"
+REMINDERS_FILE = CONFIG_DIR / "reminders.json"
 
 
 class Scheduler:
@@ -381,7 +382,7 @@ class Scheduler:
         # ── Reminders completed this week ──
         completed_count = 0
         try:
-            reminders_path = Path.home() / ".kiyomi" / "reminders.json"
+            reminders_path = REMINDERS_FILE
             if reminders_path.exists():
                 reminders_data = json.loads(reminders_path.read_text(encoding="utf-8"))
                 for r in reminders_data:
@@ -21,7 +21,7 @@ from typing import Optional
 
 from engine.skills.base import Skill
 from engine.plaid_integration import get_transactions, get_balances, is_bank_connected
-from engine.config import load_config
+from engine.config import get_plaid_creds
 
 log = logging.getLogger("kiyomi.financial_intelligence")
 
@@ -128,13 +128,7 @@ def _parse_amount(text: str) -> Optional[float]:
 
 def _get_plaid_creds() -> tuple[str, str, str]:
     """Return (client_id, secret, env) from Kiyomi config."""
-    cfg = load_config()
-    plaid_cfg = cfg.get("plaid", {})
-    return (
-        plaid_cfg.get("client_id", ""),
-        plaid_cfg.get("secret", ""),
-        plaid_cfg.get("env", "sandbox"),
-    )
+    return get_plaid_creds()
 
 
 def _fetch_transactions(days: int = 90) -> list[dict]:
@@ -27,11 +27,9 @@ from html.parser import HTMLParser
 from pathlib import Path
 from typing import Any
 
-from engine.config import CONFIG_DIR, MEMORY_DIR, ensure_dirs, load_config
+from engine.config import CONFIG_DIR, FILES_DIR, MEMORY_DIR, ensure_dirs, get_plaid_creds, load_config
 from url_reader import fetch_url
 
-FILES_DIR = CONFIG_DIR / "files"
-
 
 TOOLS = [
     {
@@ -740,11 +738,7 @@ def check_spending(days: int = 30) -> str:
         from plaid_integration import spending_summary, is_bank_connected
         if not is_bank_connected():
             return "No bank account connected yet. Ask the user to connect their bank through the Kiyomi app settings."
-        cfg = load_config()
-        plaid_cfg = cfg.get("plaid", {})
-        client_id = plaid_cfg.get("client_id", "")
-        secret = plaid_cfg.get("secret", "")
-        env = plaid_cfg.get("env", "sandbox")
+        client_id, secret, env = get_plaid_creds()
         if not client_id or not secret:
             return "Plaid is not configured yet. The user needs to add their Plaid API keys in settings."
         return spending_summary(client_id, secret, env, days)
@@ -760,11 +754,7 @@ def check_balances() -> str:
         from plaid_integration import balance_summary, is_bank_connected
         if not is_bank_connected():
             return "No bank account connected yet. Ask the user to connect their bank through the Kiyomi app settings."
-        cfg = load_config()
-        plaid_cfg = cfg.get("plaid", {})
-        client_id = plaid_cfg.get("client_id", "")
-        secret = plaid_cfg.get("secret", "")
-        env = plaid_cfg.get("env", "sandbox")
+        client_id, secret, env = get_plaid_creds()
         if not client_id or not secret:
             return "Plaid is not configured yet. The user needs to add their Plaid API keys in settings."
         return balance_summary(client_id, secret, env)
@@ -780,11 +770,7 @@ def check_category_spending(category: str, days: int = 30) -> str:
         from plaid_integration import category_spending, is_bank_connected
         if not is_bank_connected():
             return "No bank account connected yet. Ask the user to connect their bank through the Kiyomi app settings."
-        cfg = load_config()
-        plaid_cfg = cfg.get("plaid", {})
-        client_id = plaid_cfg.get("client_id", "")
-        secret = plaid_cfg.get("secret", "")
-        env = plaid_cfg.get("env", "sandbox")
+        client_id, secret, env = get_plaid_creds()
         if not client_id or not secret:
             return "Plaid is not configured yet. The user needs to add their Plaid API keys in settings."
         return category_spending(client_id, secret, env, category, days)
@@ -334,7 +334,11 @@ async def restart_bot():
             args.insert(0, executable)
         
         logger.info(f"Restarting with: {executable} {args}")
-        
+
+        # execv skips atexit, so write out any debounced bot pool claims first
+        if "engine.bot_pool" in sys.modules:
+            sys.modules["engine.bot_pool"].flush_pool()
+
         # Replace current process with new one
         os.execv(executable, args)
         
@@ -16,12 +16,14 @@ import re
 from pathlib import Path
 from typing import Dict, List, Optional
 
-from engine.config import load_config
+from engine.config import CONFIG_DIR, load_config
 from engine.memory import extract_facts_from_message, save_fact
 from engine.reminders import parse_reminder_from_message, add_reminder
 
 logger = logging.getLogger(__name__)
 
+VOICE_TEMP_DIR = CONFIG_DIR / "temp"
+
 
 async def transcribe_voice(file_path: str) -> str:
     """
@@ -278,11 +280,10 @@ async def handle_voice_message(update, context) -> str:
         voice_file = await voice.get_file()
         
         # Create temp directory if needed
-        temp_dir = Path.home() / ".kiyomi" / "temp"
-        temp_dir.mkdir(parents=True, exist_ok=True)
+        VOICE_TEMP_DIR.mkdir(parents=True, exist_ok=True)
         
         # Download to temporary file
-        voice_path = temp_dir / f"voice_{voice.file_id}.ogg"
+        voice_path = VOICE_TEMP_DIR / f"voice_{voice.file_id}.ogg"
         await voice_file.download_to_drive(voice_path)
         
         # Process voice note
@@ -118,10 +118,13 @@ def create_bots(count: int, start_index: int = 1):
                     actual_username = username
                 if not actual_username.endswith("_bot"):
                     actual_username += "_bot"
+                canonical_username = actual_username.lstrip("@")
 
                 bot = {
                     "token": token,
                     "username": actual_username,
+                    "canonical_username": canonical_username,
+                    "deep_link": f"https://t.me/{canonical_username}",
                     "display_name": display_name,
                     "claimed": False,
                     "claimed_by": None,